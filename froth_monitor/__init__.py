@@ -2,9 +2,6 @@
 
 from .image_analysis import VideoAnalysis
 from .autosaver import AutoSaver
-from .export import Export
-from .camera_thread import CameraThread
-
 
 try:
     from importlib.metadata import version
@@ -13,3 +10,17 @@ try:
 
 except Exception:
     __version__ = "0.1.0"  # Default version if metadata is unavailable
+
+
+def __getattr__(name: str):
+    # Export and CameraThread pull in PySide6, so they are only imported on
+    # first access to keep Qt out of non-GUI imports such as fm_model
+    if name == "Export":
+        from .export import Export
+
+        return Export
+    if name == "CameraThread":
+        from .camera_thread import CameraThread
+
+        return CameraThread
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,7 +1,7 @@
 """The entry point for the Bubble Analyser program."""
 
 from froth_monitor.event_handler import EventHandler
-from froth_monitor.gui_window import MainGUIWindow
+from froth_monitor.gui_window import MainGUIWindow, disable_vsync
 
 # from .gui import MainGUI
 import sys
@@ -9,7 +9,9 @@ from PySide6.QtWidgets import QApplication, QStyleFactory
 from PySide6.QtGui import QFont
 
 
-if __name__ == "__main__":
+def main() -> None:
+    """Start the application; used by ``python -m froth_monitor`` and the froth_monitor script."""
+    disable_vsync()
     app = QApplication(sys.argv)
     font = QFont("SF Pro", 11)  # You can adjust size as needed
     app.setFont(font)
@@ -28,6 +30,10 @@ if __name__ == "__main__":
     """)
     window = MainGUIWindow()
     print("starting event handler")
-    handler = EventHandler(window)
+    EventHandler(window)  # Kept alive by its parent, the window
     window.show()
     sys.exit(app.exec())
+
+
+if __name__ == "__main__":
+    main()
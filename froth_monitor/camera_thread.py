@@ -11,6 +11,8 @@ import time
 import numpy as np
 from PySide6.QtCore import QObject, Signal
 
+from froth_monitor.video_recorder import VideoRecorder
+
 
 class CameraThread(QObject):
     """
@@ -89,6 +91,10 @@ class CameraThread(QObject):
         if not self.video_capture.isOpened():
             return False
 
+        # Keep live frames (displayed and recorded) close to the camera
+        if not self.is_video_file:
+            VideoRecorder.configure_capture_for_recording(self.video_capture)
+
         # Start capture thread
         self.running = True
         self.thread_ = threading.Thread(target=self._capture_loop)
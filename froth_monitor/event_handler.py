@@ -18,13 +18,11 @@ from PySide6.QtWidgets import (
     QPushButton,
     QVBoxLayout,
 )
-from PySide6.QtCore import QTimer, Qt, QRect
-from PySide6.QtGui import QImage, QPixmap
+from PySide6.QtCore import QObject, QTimer, Qt, QRect, QPoint, QSize, Slot
 from PySide6.QtWidgets import QDialogButtonBox
-from PySide6.QtGui import QIcon
 
 # Import MainGUIWindow at the beginning
-from froth_monitor.gui_window import MainGUIWindow
+from froth_monitor.gui_window import MainGUIWindow, IconCache, disable_vsync
 
 # Import FrameModel from fm_model module
 from froth_monitor.fm_model import FrameModel
@@ -41,13 +39,15 @@ from froth_monitor.export import Export
 from froth_monitor.video_recorder import VideoRecorder
 
 
-class EventHandler:
+class EventHandler(QObject):
     """
     Event handler class that connects GUI components with application logic.
 
     This class handles events triggered by user interactions with the GUI,
     such as button clicks, menu selections, and mouse events. It manages
-    the underlying video processing, ROI analysis, and data export.
+    the underlying video processing, ROI analysis, and data export. It is a
+    QObject owned by the window, and the methods connected to signals are
+    declared as slots so the connections go through Qt's meta-object system.
 
     Attributes:
         gui: The MainGUIWindow instance to connect with.
@@ -66,6 +66,7 @@ class EventHandler:
         Args:
             gui: The MainGUIWindow instance to connect with.
         """
+        super().__init__(gui)
         self.gui = gui
         self.canvas_width = self.gui.video_canvas_label.width()
         self.canvas_height = self.gui.video_canvas_label.height()
@@ -92,6 +93,7 @@ class EventHandler:
 
         # Initialize video recorder
         self.video_recorder = VideoRecorder()
+        self.video_recorder.recording_failed.connect(self.handle_recording_failed)
         self.recording_active = False
 
         # Overlay related attributes
@@ -120,6 +122,7 @@ class EventHandler:
         self.gui.calibration_button.clicked.connect(self.start_ruler_calibration)
         self.gui.delete_roi_button.clicked.connect(self.delete_last_roi)
 
+    @Slot()
     def handle_video_import(self):
         if self.gui.webcam_radio.isChecked():
             self.load_camera_dialog()
@@ -237,15 +240,11 @@ class EventHandler:
             )
             return
 
+    @Slot()
     def pause_play(self):
         """
         Toggle between playing and pausing the video.
         """
-        def resource_path(relative_path):
-            if hasattr(sys, '_MEIPASS'):
-                return os.path.join(sys._MEIPASS, relative_path) # type: ignore
-            return relative_path
-
         if not self.camera_thread.is_running() and not self.playing:
             QMessageBox.warning(self.gui, "Warning", "No video source loaded!")
             return
@@ -257,7 +256,7 @@ class EventHandler:
             self.playing = False
             self.gui.statusBar().showMessage("Video paused")
             # Change icon to play icon when paused
-            self.gui.play_pause_button.setIcon(QIcon(resource_path("froth_monitor/resources/play_icon.ico")))
+            self.gui.play_pause_button.setIcon(IconCache.play())
         else:
             # If the thread is running but paused, just resume it
             if self.camera_thread.is_running() and self.camera_thread.is_paused():
@@ -265,7 +264,7 @@ class EventHandler:
                 self.playing = True
                 self.gui.statusBar().showMessage("Video resumed")
                 # Change icon to pause icon when playing
-                self.gui.play_pause_button.setIcon(QIcon(resource_path("froth_monitor/resources/pause_icon.ico")))
+                self.gui.play_pause_button.setIcon(IconCache.pause())
 
             # If the thread is not running, we need to restart it
             elif hasattr(self, "last_video_source"):
@@ -312,6 +311,7 @@ class EventHandler:
         # Bring the overlay to the front
         self.overlay_widget.raise_()
 
+    @Slot()
     def reset_mission(self):
         """Reset the application for a new mission."""
         # Check if data has been saved
@@ -338,11 +338,12 @@ class EventHandler:
         self.confirm_calibration = False
         self.camera_thread.reset()
         self.gui.video_canvas_label.clear()
-        self.gui.plot_widget.clear()
+        self.gui.remove_velocity_curves()
         self.frame_model.reset()
         self.overlay_widget.reset()
 
     # -----------------------------------Frame Processing-----------------------------------------------
+    @Slot(object)
     def process_new_frame(self, frame):
         """
         Process and display a new frame received from the camera thread.
@@ -359,13 +360,11 @@ class EventHandler:
         # Store the current frame for potential further processing
         self.current_frame = frame
 
-        # Convert frame to QImage and scale it
-        qt_image = self._convert_frame_to_qimage(frame)
-        scaled_image = self._scale_image_to_canvas(qt_image)
-
-        # Create a resized frame for processing
+        # Resize the frame to fit the canvas once; the model processes the
+        # resized frame and the canvas displays it without scaling
+        display_size = self._fit_to_canvas(frame)
         resized_frame = self._create_resized_frame(
-            frame, scaled_image.width(), scaled_image.height()
+            frame, display_size.width(), display_size.height()
         )
 
         # Process the frame with the frame model
@@ -377,47 +376,30 @@ class EventHandler:
         self.camera_thread.if_release = True
 
         # Display the frame on the canvas
-        pixmap = self._display_frame_on_canvas(scaled_image)
+        self._display_frame_on_canvas(resized_frame)
 
         # Update the overlay position
-        self._update_overlay_position(pixmap)
+        self._update_overlay_position(display_size)
 
         # Record frame if recording is active
-        if self.recording_active and self.video_recorder.is_active():
+        if self.recording_active and self.video_recorder.is_recording:
             self.video_recorder.record_frame(frame)
 
         # Update status bar
         self._update_status_bar()
 
-    def _convert_frame_to_qimage(self, frame):
-        """
-        Convert an OpenCV frame (BGR) to a Qt QImage (RGB).
-
-        Args:
-            frame: OpenCV frame in BGR format
-
-        Returns:
-            QImage: The converted Qt image
-        """
-        # Convert the frame from BGR to RGB format (OpenCV uses BGR, Qt uses RGB)
-        rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-
-        # Create a QImage from the frame data
-        h, w, ch = rgb_frame.shape
-        bytes_per_line = ch * w
-        return QImage(rgb_frame.data, w, h, bytes_per_line, QImage.Format.Format_RGB888)
-
-    def _scale_image_to_canvas(self, qt_image):
+    def _fit_to_canvas(self, frame):
         """
-        Scale the QImage to fit the canvas while maintaining aspect ratio.
+        Get the size of the frame scaled to fit the canvas while maintaining aspect ratio.
 
         Args:
-            qt_image: The QImage to scale
+            frame: The frame to fit
 
         Returns:
-            QImage: The scaled image
+            QSize: The scaled size
         """
-        return qt_image.scaled(
+        h, w = frame.shape[:2]
+        return QSize(w, h).scaled(
             self.canvas_width, self.canvas_height, Qt.AspectRatioMode.KeepAspectRatio
         )
 
@@ -431,8 +413,10 @@ class EventHandler:
             height: Target height
 
         Returns:
-            ndarray: Resized frame
+            ndarray: Resized frame, or the frame itself if it already has that size
         """
+        if frame.shape[1] == width and frame.shape[0] == height:
+            return frame
         return cv2.resize(frame, (width, height))
 
     def _process_frame_with_model(self, resized_frame):
@@ -442,46 +426,40 @@ class EventHandler:
         Args:
             resized_frame: The resized frame to process
         """
-        self.current_frame_number, roi_list, update_velo_plot, update_average_velo\
-             = self.frame_model.process_frame(
-            resized_frame
-        )
-        self.display_roi(roi_list)
+        result = self.frame_model.process_frame(resized_frame)
+        self.current_frame_number = result.frame_number
+        self.display_roi(self.frame_model.roi_list)
 
         # Update the velocity plot with the latest data
-        if update_velo_plot:
+        if result.update_velo_plot:
             self.update_velocity_plot()
 
         # Update the average velocity label
-        if update_average_velo:
+        if result.update_average_velo:
             self.update_ave_velo_table()
 
-    def _display_frame_on_canvas(self, scaled_image):
+    def _display_frame_on_canvas(self, display_frame):
         """
-        Convert the QImage to a QPixmap and display it on the video canvas.
+        Display the BGR frame on the video canvas without copying it.
 
-        Args:
-            scaled_image: The scaled QImage to display
+        The canvas converts it when it repaints, which Qt does at most once per
+        screen refresh however many frames arrive in between.
 
-        Returns:
-            QPixmap: The pixmap that was set on the canvas
+        Args:
+            display_frame: The BGR frame to display, already resized to fit the canvas
         """
-        pixmap = QPixmap.fromImage(scaled_image)
-        self.gui.video_canvas_label.setPixmap(pixmap)
-        return pixmap
+        self.gui.video_canvas_label.set_frame(display_frame)
 
-    def _update_overlay_position(self, pixmap):
+    def _update_overlay_position(self, size):
         """
         Update the position and size of the overlay widget based on the video dimensions.
 
         Args:
-            pixmap: The pixmap displayed on the canvas
+            size: The size of the frame displayed on the canvas
         """
-        if pixmap.width() < self.canvas_width or pixmap.height() < self.canvas_height:
-            # Calculate the position of the video within the canvas (centered)
-            x_offset = (self.canvas_width - pixmap.width()) // 2
-            y_offset = (self.canvas_height - pixmap.height()) // 2
-            self.video_rect = QRect(x_offset, y_offset, pixmap.width(), pixmap.height())
+        if size.width() < self.canvas_width or size.height() < self.canvas_height:
+            # Position of the video within the canvas, as painted by the canvas
+            self.video_rect = self.gui.video_canvas_label.image_rect(size)
 
             # Update overlay widget geometry if it exists
             if self.overlay_widget and self.overlay_active:
@@ -500,6 +478,7 @@ class EventHandler:
             )
 
     # ------------------------------------Ruler Drawing------------------------------------------------
+    @Slot()
     def start_ruler_calibration(self):
         """Start the ruler calibration mode for measuring distances in pixels."""
         # Check if video is loaded
@@ -521,6 +500,7 @@ class EventHandler:
             "Click and drag to draw a line of 2cm for pixel measurement"
         )
 
+    @Slot(float)
     def handle_ruler_measurement(self, px):
         """Handle the ruler measurement result.
 
@@ -533,7 +513,7 @@ class EventHandler:
         px_ratio = float(px/distance)
         
         self.frame_model.get_px_to_mm(px_ratio)
-        self.gui.px2mm_result_textbox.setText(f"{self.frame_model.px2mm:.1f}")
+        self.gui.px2mm_result_textbox.setValue(self.frame_model.px2mm)
         # Display the measurement result to the user
         QMessageBox.information(
             self.gui,
@@ -550,6 +530,7 @@ class EventHandler:
         # self.calibration_value = distance
 
     # ------------------------------------ROi Drawing--------------------------------------------------
+    @Slot()
     def add_roi(self):
         """Add a new Region of Interest to the video."""
         # Check if video is loaded
@@ -587,6 +568,7 @@ class EventHandler:
             "Click and drag to draw a Region of Interest rectangle"
         )
 
+    @Slot(QRect)
     def handle_roi_created(self, rect):
         """Handle the creation of a new ROI rectangle.
 
@@ -634,12 +616,14 @@ class EventHandler:
             return
         self.overlay_widget.display_roi(roi_list)
 
+    @Slot()
     def delete_last_roi(self):
         self.frame_model.delete_last_roi()
         self.overlay_widget.update()
         self.gui.statusBar().showMessage("Last ROI deleted")
         
     # ------------------------------------Arrow Drawing------------------------------------------------
+    @Slot()
     def confirm_arrow_n_ruler(self):
         """Confirm the current arrow direction."""
         # Placeholder for arrow confirmation
@@ -652,20 +636,11 @@ class EventHandler:
             )
             return
 
-        try:
-            arrow_direction = float(self.gui.direction_textbox.text())
-            px_distance = float(self.gui.px2mm_result_textbox.text())
-            self.frame_model.get_px_to_mm(px_distance)
-            self.frame_model.get_overflow_direction(arrow_direction)
-
-        except ValueError:
-            print(ValueError)
-            QMessageBox.warning(
-                self.gui,
-                "Warning",
-                "Please enter valid arrow direction and px2mm values.",
-            )
-            return
+        # The spin boxes only accept numbers within their ranges
+        arrow_direction = self.gui.direction_textbox.value()
+        px_distance = self.gui.px2mm_result_textbox.value()
+        self.frame_model.get_px_to_mm(px_distance)
+        self.frame_model.get_overflow_direction(arrow_direction)
 
         self.confirm_calibration = True
         QMessageBox.information(
@@ -674,6 +649,7 @@ class EventHandler:
             "Overflow direction (arrow) and calibration (ruler) confirmed.",
         )
 
+    @Slot()
     def start_arrow_drawing(self):
         """Start the arrow drawing mode."""
 
@@ -706,6 +682,7 @@ class EventHandler:
             "Click and drag to draw a line of 2cm for pixel measurement"
         )
 
+    @Slot(QPoint, QPoint, float)
     def handle_arrow_drawing(self, start_pos, end_pos, degree):
         # Placeholder for arrow drawing result handling
         """Handle the ruler measurement result.
@@ -715,7 +692,7 @@ class EventHandler:
         """
 
         self.frame_model.get_overflow_direction(degree)
-        self.gui.direction_textbox.setText(f"{degree:.2f}")
+        self.gui.direction_textbox.setValue(degree)
 
         # Display the measurement result to the user
         QMessageBox.information(
@@ -727,6 +704,7 @@ class EventHandler:
         # Update the status bar
         self.gui.statusBar().showMessage(f"arrow angle: {degree:.1f} degrees")
 
+    @Slot()
     def toggle_recording(self):
         """Start or stop video recording."""
         # Check if video is loaded
@@ -772,15 +750,6 @@ class EventHandler:
             if success:
                 self.recording_active = True
                 self.gui.record_button.setText("  Stop Recording")
-                self.gui.record_button.setStyleSheet(
-                    "QPushButton {\
-                        background-color: red; color: white; font-size: 15px; \
-                        padding: 5px; border-radius: 4px;\
-                    }\
-                    QPushButton:hover {\
-                        background-color: #3367d6;\
-                    }"
-                )
                 self.gui.statusBar().showMessage(f"Recording started: {self.video_recorder.output_path}")
             else:
                 QMessageBox.critical(
@@ -788,27 +757,17 @@ class EventHandler:
                 )
         else:
             # Stop recording
-            success, output_path, frame_count = self.video_recorder.stop_recording()
+            success, output_path, frame_count, dropped_frames = self.video_recorder.stop_recording()
             
             if success:
                 self.recording_active = False
                 self.gui.record_button.setText("  Start Recording")
-                self.gui.record_button.setStyleSheet(
-                    "QPushButton {\
-                        background-color: red; color: white; font-size: 15px; \
-                        padding: 5px; border-radius: 4px;\
-                    }\
-                    QPushButton:hover {\
-                        background-color: #3367d6;\
-                    }"
-                )
                 
                 # Show success message with recording statistics
-                QMessageBox.information(
-                    self.gui,
-                    "Recording Completed",
-                    f"Video saved to: {output_path}\nFrames recorded: {frame_count}"
-                )
+                message = f"Video saved to: {output_path}\nFrames recorded: {frame_count}"
+                if dropped_frames:
+                    message += f"\nFrames dropped: {dropped_frames}"
+                QMessageBox.information(self.gui, "Recording Completed", message)
                 
                 self.gui.statusBar().showMessage(f"Recording stopped: {output_path}")
             else:
@@ -816,6 +775,15 @@ class EventHandler:
                     self.gui, "Warning", "No active recording to stop."
                 )
 
+    @Slot(str)
+    def handle_recording_failed(self, reason: str):
+        """Reset the recording controls after the recorder stopped a recording itself."""
+        self.recording_active = False
+        self.gui.record_button.setText("  Start Recording")
+        self.gui.statusBar().showMessage("Recording failed")
+        QMessageBox.critical(self.gui, "Recording Failed", f"Recording stopped: {reason}")
+
+    @Slot()
     def export_settings(self):
         """Open export settings dialog."""
         # Placeholder for export settings
@@ -836,6 +804,7 @@ class EventHandler:
         else:
             return True
 
+    @Slot()
     def save_data(self):
         """Save the current analysis data."""
         self.if_save = self.export.excel_results(
@@ -854,9 +823,11 @@ class EventHandler:
         The plot displays a fixed window of 30 elements (3 seconds) with new data appearing
         from the right edge and older data scrolling to the left. When the history exceeds
         30 elements, the oldest elements are removed to maintain the fixed window size.
+        The curves are kept between updates and their data is replaced on the next
+        screen refresh.
         """
-        # Clear the plot widget
-        self.gui.plot_widget.clear()
+        # Drop the curves of deleted ROIs
+        self.gui.remove_velocity_curves(len(self.frame_model.roi_list))
 
         # Check if there are any ROIs to plot
         if not self.frame_model.roi_list:
@@ -873,9 +844,6 @@ class EventHandler:
             "w",
         ]  # Red, green, blue, cyan, magenta, yellow, white
 
-        # Fixed window size (3 seconds)
-        WINDOW_SIZE = 30
-
         # Find the maximum velocity across all ROIs for y-axis scaling
         max_velocity = 0
         if self.frame_model.roi_list and any(
@@ -895,77 +863,24 @@ class EventHandler:
             # Get color for this ROI (cycle through colors if more ROIs than colors)
             color = colors[i % len(colors)]
 
-            # Get the velocity history data
-            history = roi.velo_only_history
-
-            # Limit history to the most recent WINDOW_SIZE elements
-            if len(history) > WINDOW_SIZE:
-                history = history[-WINDOW_SIZE:]
-
-            # Create a fixed-size array for display (30 elements)
-            display_data = [None] * WINDOW_SIZE
-
-            # Position the data at the right side of the display
-            # For example, if we have 5 elements, they go in positions 25-29 (0-indexed)
-            start_pos = WINDOW_SIZE - len(history)
-            for j, value in enumerate(history):
-                display_data[start_pos + j] = value
-
-            # Create x-axis data (fixed range from 0 to WINDOW_SIZE-1)
-            x_data = list(range(WINDOW_SIZE))
-
-            # Create y-axis data with None values filtered out for plotting
-            # (pyqtgraph will skip None values when plotting)
-            plot_x = []
-            plot_y = []
-            for x, y in zip(x_data, display_data):
-                if y is not None:
-                    plot_x.append(x)
-                    plot_y.append(y)
-
-            # Add the plot with a label for the legend
-            if plot_x and plot_y:  # Only plot if we have data
-                self.gui.plot_widget.plot(
-                    plot_x, plot_y, pen=color, name=f"ROI {i + 1}"
-                )
-
-        # Set fixed x-axis range (0 to WINDOW_SIZE-1)
-        self.gui.plot_widget.setXRange(0, WINDOW_SIZE - 1)
+            # Position the most recent VELOCITY_PLOT_WINDOW values at the right side of the
+            # display; e.g. 5 values go in positions 25-29 (0-indexed)
+            self.gui.schedule_plot_update(i, roi.velo_only_history, color)
 
-        # Set appropriate y-axis range if there's data
+        # Set appropriate y-axis range if there's data; the x-axis range is fixed
         if max_velocity > 0:
             # Add some padding to the top of the y-axis
-            self.gui.plot_widget.setYRange(0, max_velocity * 1.1)
-
-        # Update the plot
-        self.gui.plot_widget.update()
+            self.gui.rescale_y(0, max_velocity * 1.1)
 
     def update_ave_velo_table(self):
         """Update the average velocity table with data from all ROIs."""
-        # Clear the table
-        self.gui.table_widget.clear()
-        self.gui.table_widget.setRowCount(len(self.frame_model.roi_list))
-
-        list_data = []
-        # Add data to the table
-        for i, roi in enumerate(self.frame_model.roi_list):
-            # Skip if no velocity history
-            if roi.average_velocity_past_30s is None:
-                list_data.append("N/A")
-                continue
-                
-            print(list_data)
-            # Add average velocity to the table
-            list_data.append(roi.average_velocity_past_30s)
-        
-        self.gui.table_widget.setData(list_data)
-        self.gui.table_widget.setHorizontalHeaderLabels(["mean_velocity  "])
-        self.gui.table_widget.setFormat("%.2f")
-        self.gui.table_widget.setColumnWidth(0, 120)
-        # self.table_widget.setColumnWidth(1, 100)
-        self.gui.table_widget.setFixedHeight(200)
+        # ROIs without velocity history are shown as N/A
+        self.gui.set_mean_velocities(
+            [roi.average_velocity_past_30s for roi in self.frame_model.roi_list]
+        )
 
 if __name__ == "__main__":
+    disable_vsync()
     app = QApplication(sys.argv)
     app.setStyle("macintosh")
     app.setStyleSheet("""
@@ -45,6 +45,32 @@ from PySide6.QtGui import QFont
 from datetime import datetime
 from openpyxl import Workbook
 
+# Style sheet of the export settings dialog, set once on the dialog and
+# applied to its widgets by objectName
+DIALOG_STYLESHEET = """
+QLabel#sectionLabel {
+    color: black;
+    font-size: 18px;
+    font-weight: bold;
+    border-radius: 4px;
+}
+QLabel#directory_display {
+    color: black;
+    font-size: 15px;
+    padding: 5px;
+    border-radius: 4px;
+}
+QPushButton#dialogButton {
+    background-color: #4285f4;
+    color: white;
+    font-size: 15px;
+    padding: 5px;
+    border-radius: 4px;
+}
+QPushButton#dialogButton:hover {
+    background-color: #3367d6;
+}
+"""
 
 class Export(QFileDialog):
     """
@@ -147,29 +173,17 @@ class Export(QFileDialog):
         dialog = QDialog(self.gui)
         dialog.setWindowTitle("Export Settings")
         dialog.setMinimumWidth(400)
+        dialog.setStyleSheet(DIALOG_STYLESHEET)
         layout = QVBoxLayout(dialog)
 
         # Export Directory Selection
         directory_label = QLabel("Data Export Location:", dialog)
         directory_label.setFont(self.font_big)
-        directory_label.setStyleSheet(
-            "color: black; font-size: 18px; \
-            font-weight:bold; border-radius: 4px;"
-        )
+        directory_label.setObjectName("sectionLabel")
         layout.addWidget(directory_label)
 
         directory_button = QPushButton("Select export location for csv data", dialog)
-        directory_button.setStyleSheet(
-            """
-            QPushButton {
-                background-color: #4285f4; color: white; font-size: 15px; \
-            padding: 5px; border-radius: 4px;
-            }
-            QPushButton:hover {
-                background-color: #3367d6;
-            }
-            """
-        )
+        directory_button.setObjectName("dialogButton")
         directory_button.clicked.connect(lambda: self.select_data_directory(dialog))
         layout.addWidget(directory_button)
 
@@ -177,10 +191,6 @@ class Export(QFileDialog):
         directory_display = QLabel(
             self.export_directory if self.export_directory else "Not selected", dialog
         )
-        directory_display.setStyleSheet(
-            "color: black; font-size: 15px; \
-            padding: 5px; border-radius: 4px;"
-        )
         directory_display.setObjectName(
             "directory_display"
         )  # Assign a unique name for findChild
@@ -205,17 +215,7 @@ class Export(QFileDialog):
 
         # Save Button
         save_button = QPushButton("Save Settings", dialog)
-        save_button.setStyleSheet(
-            """
-            QPushButton {
-                background-color: #4285f4; color: white; font-size: 15px; \
-            padding: 5px; border-radius: 4px;
-            }
-            QPushButton:hover {
-                background-color: #3367d6;
-            }
-            """
-        )
+        save_button.setObjectName("dialogButton")
         save_button.clicked.connect(
             lambda: self.save_export_settings(dialog, filename_input)
         )
@@ -267,10 +267,7 @@ class Export(QFileDialog):
 
         title_label = QLabel("Video Recording Options")
         title_label.setFont(self.font_big)
-        title_label.setStyleSheet(
-            "color: black; font-size: 18px; \
-            font-weight:bold; border-radius: 4px;"
-        )
+        title_label.setObjectName("sectionLabel")
         layout.addWidget(title_label)
 
         # Save Recording Video Options
@@ -299,17 +296,7 @@ class Export(QFileDialog):
         no_radio.toggled.connect(on_radio_selection)
 
         self.recording_video_directory_button = QPushButton("Set Export Location for Recording")
-        self.recording_video_directory_button.setStyleSheet(
-            "\
-            QPushButton {\
-                background-color: #4285f4; color: white; font-size: 15px; \
-            padding: 5px; border-radius: 4px;\
-            }\
-            QPushButton:hover {\
-                background-color: #3367d6;\
-            }\
-            "
-        )
+        self.recording_video_directory_button.setObjectName("dialogButton")
         recording_video_directory_display = QLabel("Not selected", dialog)
         recording_video_directory_display.setObjectName(
             "recording_video_directory_display"
@@ -14,7 +14,7 @@ Imports:
 --------
 - cv2 (OpenCV): For image processing operations.
 - numpy: For numerical operations on frame data.
-- datetime: For timestamp generation.
+- time: For timestamp generation.
 
 Example Usage:
 --------------
@@ -33,115 +33,199 @@ print(f"Processing frame {frame_number}")
 ```
 """
 
+import cv2
+import math
 import numpy as np
 import time
-from typing import cast
-from datetime import datetime
-from PySide6.QtCore import QRect
+from typing import TYPE_CHECKING, NamedTuple, cast
 from froth_monitor.image_analysis import VideoAnalysis
 
+if TYPE_CHECKING:
+    from PySide6.QtCore import QRect
+
+
+class FrameResult(NamedTuple):
+    """
+    Result of FrameModel.process_frame.
+
+    The arrays are owned by the FrameModel and are overwritten on the next frame;
+    row i corresponds to roi_list[i].
+    """
+
+    frame_number: int
+    # Latest (x, y) delta pixels of each ROI, NaN until the ROI has a result
+    deltas: np.ndarray
+    # Velocity being accumulated in the current second by each ROI (mm/s)
+    velocities: np.ndarray
+    # "HH:MM:SS" timestamp of the frame
+    timestamp: str
+    update_velo_plot: bool
+    update_average_velo: bool
+
 
 class ROI:
-    def __init__(self, roi_coordinate: QRect, px2mm, degree) -> None:
+    def __init__(self, roi_coordinate: "QRect", px2mm, degree) -> None:
         self.coordinate = roi_coordinate
-        self.analysis = VideoAnalysis(0, 0)
+        # Grayscale previous frame of this ROI, the only per-ROI analysis state
+        self.previous_frame = None
 
         self.delta_pixels = None
         self.cross_position = None
 
-        self.delta_history = []
+        # (rows, columns) slices of the frame covered by this ROI, set by FrameModel
+        self._slice_yx = (slice(0, 0), slice(0, 0))
+
+        # History of per-frame results stored as parallel arrays which grow by
+        # doubling when full; only the first self._n rows are valid. float64
+        # keeps the exported values identical to the Python floats they hold
+        self._cap = 1024
+        self._n = 0
+        self._ts = np.empty(self._cap, dtype="S8")
+        self._delta_pixels = np.empty((self._cap, 2), dtype=np.float64)
+        self._calibrated_delta = np.empty(self._cap, dtype=np.float64)
+        self._velocity = np.full(self._cap, np.nan, dtype=np.float64)
+
         self.arrow_dir = 0.0
         self.px2mm = px2mm
         self.mm2px = 1 / px2mm
         self.degree = degree
 
-        # Initialize timestamp
-        self.timestamp = time.strftime("%H:%M:%S", time.localtime())
-        self.timestamp_buffer = self.timestamp
+        # Initialize timestamp; velocities are accumulated per integer second
+        # (self._sec_bucket) and self.timestamp is only kept for display/export
+        self._sec_bucket = int(time.time())
+        self.timestamp = time.strftime("%H:%M:%S", time.localtime(self._sec_bucket))
         self.current_velocity = 0.0
         self.velo_only_history = []
 
         self.average_velocity_past_30s = cast(float, None)
 
-    def process_frame(self, frame: np.ndarray) -> tuple[bool, bool]:
+    @property
+    def delta_history(self) -> list[list]:
         """
-        Process a cropped frame using the VideoAnalysis.analyze function and store the results.
+        The per-frame results as rows of [timestamp, delta_pixels, calibrated_delta,
+        velocity], where velocity is None unless the row closed a one-second bucket.
+        """
+        n = self._n
+        velocities = [
+            None if np.isnan(v) else v for v in self._velocity[:n].tolist()
+        ]
+        return [
+            [ts.decode(), tuple(dp), cd, v]
+            for ts, dp, cd, v in zip(
+                self._ts[:n].tolist(),
+                self._delta_pixels[:n].tolist(),
+                self._calibrated_delta[:n].tolist(),
+                velocities,
+            )
+        ]
+
+    @property
+    def degree(self) -> float:
+        return self._degree
+
+    @degree.setter
+    def degree(self, degree: float) -> None:
+        """
+        Set the overflow direction and cache the components of its unit vector.
+
+        In the coordinate system, 0 degrees points right and angles increase
+        counterclockwise, but the y-axis is inverted (positive y is downward),
+        so the y component is negated.
+        """
+        self._degree = degree
+        rad = math.radians(degree)
+        self._cos = math.cos(rad)
+        self._sin = -math.sin(rad)
+
+    def process_frame(
+        self, frame: np.ndarray, timestamp: str, sec: int, analyzer: VideoAnalysis
+    ) -> tuple[bool, bool]:
+        """
+        Process a cropped frame using the VideoAnalysis.analyze_pair function and store the results.
 
         Parameters
         ----------
         frame : np.ndarray
             The cropped video frame to process.
+        timestamp : str
+            The "HH:MM:SS" timestamp of the frame.
+        sec : int
+            The integer second (time.time()) that the timestamp refers to.
+        analyzer : VideoAnalysis
+            The analyzer shared by all ROIs.
         """
 
-        self.delta_pixels = self.analysis.analyze(frame)
-
-        if self.delta_pixels == (None, None):
-            return False, False
-
-        self.calibrated_delta = self.calculate_real_delta(self.delta_pixels)
-
-        # Update timestamp
-        self.timestamp = time.strftime("%H:%M:%S", time.localtime())
-        if_new_velo = self.calculate_velocity(self.calibrated_delta)
-        if_new_average = self.calculate_average_velocity()
-        self.delta_history.append(
-            [self.timestamp, self.delta_pixels, self.calibrated_delta, None]
+        delta_pixels, self.previous_frame = analyzer.analyze_pair(
+            self.previous_frame, frame
         )
-        
-        return if_new_velo, if_new_average
+        return self.process_delta(delta_pixels, timestamp, sec)
 
-    def calculate_real_delta(self, delta_pixels):
+    def process_delta(
+        self, delta_pixels: tuple[float, float], timestamp: str, sec: int
+    ) -> tuple[bool, bool]:
         """
-        Calculate the projection of delta_pixels onto the direction specified by self.degree.
+        Store the delta pixels computed for this ROI and update its velocity results.
 
         Parameters
         ----------
-        delta_pixels : tuple or list
-            A tuple or list containing (x, y) movement in pixels, where positive x means
-            movement to the right and positive y means movement downward.
-
-        Returns
-        -------
-        float
-            The projected velocity in the direction of self.degree in mm/frame.
+        delta_pixels : tuple[float, float]
+            The (x, y) movement in pixels returned by VideoAnalysis.analyze_pair.
+        timestamp : str
+            The "HH:MM:SS" timestamp of the frame.
+        sec : int
+            The integer second (time.time()) that the timestamp refers to.
         """
 
-        import math
+        self.delta_pixels = delta_pixels
 
-        # Convert degree to radians
-        rad = math.radians(self.degree)
-
-        # Create a unit vector in the direction of self.degree
-        # Note: In the coordinate system, 0 degrees points right, and angles increase counterclockwise
-        # But y-axis is inverted (positive y is downward), so we need to negate the y component
-        direction_x = math.cos(rad)
-        direction_y = -math.sin(rad)  # Negative because positive y is downward
+        if delta_pixels == (None, None):
+            return False, False
 
-        # Extract delta_x and delta_y from delta_pixels
+        # Project onto the overflow direction and convert from pixels to mm
         delta_x, delta_y = delta_pixels
+        self.calibrated_delta = (delta_x * self._cos + delta_y * self._sin) * self.mm2px
 
-        # Calculate the dot product (projection)
-        projection = delta_x * direction_x + delta_y * direction_y
-
-        # Convert from pixels to millimeters
-        projection_mm = projection * self.mm2px
-
-        return projection_mm
+        # Update timestamp
+        self.timestamp = timestamp
+        if_new_velo = self.calculate_velocity(self.calibrated_delta, sec)
+        if_new_average = self.calculate_average_velocity()
+        self._append_history()
 
-    def calculate_velocity(self, delta) -> bool:
+        return if_new_velo, if_new_average
 
-        if self.timestamp == self.timestamp_buffer:
+    def _append_history(self) -> None:
+        """
+        Append the current frame results to the history arrays, doubling their
+        capacity when full.
+        """
+        if self._n == self._cap:
+            self._cap *= 2
+            self._ts = np.resize(self._ts, self._cap)
+            self._delta_pixels = np.resize(self._delta_pixels, (self._cap, 2))
+            self._calibrated_delta = np.resize(self._calibrated_delta, self._cap)
+            self._velocity = np.resize(self._velocity, self._cap)
+            self._velocity[self._n :] = np.nan
+
+        n = self._n
+        self._ts[n] = self.timestamp
+        self._delta_pixels[n] = self.delta_pixels
+        self._calibrated_delta[n] = self.calibrated_delta
+        self._n = n + 1
+
+    def calculate_velocity(self, delta, sec: int) -> bool:
+
+        if sec == self._sec_bucket:
             self.current_velocity += delta
             return False
 
         else:
-            self.timestamp_buffer = self.timestamp
+            self._sec_bucket = sec
 
             # if len(self.delta_history) == 1:
             #     self.delta_history[0][-1] = self.current_velocity
             # else:
-            if len(self.delta_history) > 1:
-                self.delta_history[-1][-1] = self.current_velocity
+            if self._n > 1:
+                self._velocity[self._n - 1] = self.current_velocity
             
             self.velo_only_history.append(self.current_velocity)
             self.current_velocity = delta
@@ -169,9 +253,11 @@ class FrameModel:
     frame_count : int
         Counter for the number of frames processed.
     frame_history : list
-        Stores information about processed frames.
+        Information about processed frames, rebuilt from the history arrays.
     last_processed_time : datetime
         Timestamp of the last processed frame.
+    use_gpu : bool
+        Whether ROI analysis runs on the OpenCL device through cv2.UMat.
 
     Methods:
     -------
@@ -185,6 +271,8 @@ class FrameModel:
         Returns the history of processed frames.
     get_current_time() -> str
         Returns the current timestamp in the format "dd/mm/yyyy HH:MM:SS.sss".
+    get_current_timestamp() -> str
+        Returns the current timestamp in the format "HH:MM:SS", cached per second.
     """
 
     def __init__(self) -> None:
@@ -192,35 +280,59 @@ class FrameModel:
         Initialize the FrameModel with default values.
         """
         self.frame_count = 0
-        self.frame_history = []
+        self._init_frame_history()
 
         self.roi_list = []
+        # ROI coordinates as rows of (x, y, width, height), aligned with roi_list
+        self._roi_coords = np.empty((0, 4), dtype=np.int32)
+        # ROIs that overlap the frame and their (x1, y1, x2, y2) bounds clipped to
+        # it, recomputed only when the ROIs or the frame shape change
+        self._frame_shape: tuple[int, ...] | None = None
+        self._active_rois: list[ROI] = []
+        self._roi_bounds: list[list[int]] = []
+        self._active_idx: list[int] = []
+        # Latest per-ROI results, returned by reference in FrameResult
+        self._deltas = np.full((0, 2), np.nan, dtype=np.float32)
+        self._velocities = np.zeros(0, dtype=np.float32)
         self.last_processed_time = None
 
         self.px2mm = 1.0
         self.degree = -90.0
 
-    def process_frame(self, frame: np.ndarray) -> tuple[int, list[ROI], bool, bool]:
+        # Cache of the "HH:MM:SS" timestamp, rebuilt only when the second changes
+        self._last_sec_int = -1
+        self._last_sec_str = ""
+        # Cache of the "dd/mm/yyyy HH:MM:SS" prefix used by get_current_time
+        self._cached_sec = -1
+        self._cached_prefix = ""
+
+        # Optical flow analyzer shared by all ROIs, which keep their own previous frame
+        self._analyzer = VideoAnalysis(0, 0)
+
+        # Run the ROI analysis on the OpenCL device through cv2.UMat if available
+        self.use_gpu = cv2.ocl.haveOpenCL()
+
+    def process_frame(self, frame: np.ndarray) -> FrameResult:
         """
         Process a video frame, increment the frame counter, and return the frame number
-        along with the processed frame. For each ROI in the roi_list, crop the frame
-        according to the ROI coordinates and pass the cropped frame to the ROI's
-        process_frame method.
+        along with the latest ROI results. For each ROI in the roi_list, crop the frame
+        according to the ROI coordinates and pass the result of the analysis of the
+        cropped frame to the ROI's process_delta method.
 
         Parameters
         ----------
         frame : np.ndarray
-            The video frame to process.
+            The video frame to process. Must not be None; CameraThread only emits
+            frames that VideoCapture.read() returned successfully.
 
         Returns
         -------
-        tuple[int, np.ndarray]
-            A tuple containing the frame number and the processed frame.
+        FrameResult
+            The frame number, the latest deltas and velocities of the ROIs, the
+            timestamp and whether the velocity plot and average table need updating.
         """
 
         time_1 = time.time()
-        if frame is None:
-            return None, None
 
         # Increment the frame counter
         self.frame_count += 1
@@ -229,34 +341,59 @@ class FrameModel:
         current_time = self.get_current_time()
         self.last_processed_time = current_time
 
-        # Store frame information in history
-        self.frame_history.append(
-            {"frame_number": self.frame_count, "timestamp": current_time}
-        )
+        # Store frame information in history, doubling the buffers when full
+        n = self.frame_count - 1
+        if n == len(self._fn_buf):
+            self._fn_buf = np.resize(self._fn_buf, 2 * n)
+            self._ts_buf = np.resize(self._ts_buf, 2 * n)
+        self._fn_buf[n] = self.frame_count
+        self._ts_buf[n] = current_time
+
+        # Format the ROI timestamp once per frame rather than once per ROI
+        timestamp = self.get_current_timestamp()
 
         if_new_velo = 0
         if_new_average = 0
         update_velo_plot = False
         update_average_velo = False
-        # Process each ROI in the roi_list
-        for roi in self.roi_list:
-            # Get the ROI coordinates
-            x1 = roi.coordinate[0]
-            y1 = roi.coordinate[1]
-            x2 = roi.coordinate[2]
-            y2 = roi.coordinate[3]
-
-            # Crop the frame according to the ROI coordinates
-            # Ensure the coordinates are within the frame boundaries
-            if x1 >= 0 and y1 >= 0 and x2 > 0 and y2 > 0:
-                cropped_frame = frame[y1 : y1 + y2, x1 : x1 + x2]
-
-                # Pass the cropped frame to the ROI's process_frame method
-                _new_velo, _new_average = roi.process_frame(cropped_frame)
-                if _new_velo == True:
-                    if_new_velo += 1
-                if _new_average == True:
-                    if_new_average += 1
+
+        # Re-clip the ROI bounds only if the frame shape has changed
+        if frame.shape[:2] != self._frame_shape:
+            self._frame_shape = frame.shape[:2]
+            self._update_roi_bounds()
+
+        # Crop the frame for each ROI (slices are views, no copy is made)
+        rois = self._active_rois
+        if self.use_gpu:
+            # Upload the frame once; the crops are UMat headers into it
+            umat = cv2.UMat(frame)
+            cropped_frames = [
+                cv2.UMat(umat, (y1, y2), (x1, x2))
+                for x1, y1, x2, y2 in self._roi_bounds
+            ]
+        else:
+            cropped_frames = [frame[roi._slice_yx] for roi in rois]
+
+        # Analyze all cropped frames in a single batch call
+        results = self._analyzer.analyze_batch(
+            [roi.previous_frame for roi in rois], cropped_frames
+        )
+
+        # Pass the delta pixels to each ROI's process_delta method
+        for i, roi, (delta_pixels, previous_frame) in zip(
+            self._active_idx, rois, results
+        ):
+            roi.previous_frame = previous_frame
+            _new_velo, _new_average = roi.process_delta(
+                delta_pixels, timestamp, self._last_sec_int
+            )
+            if _new_velo == True:
+                if_new_velo += 1
+            if _new_average == True:
+                if_new_average += 1
+            if delta_pixels != (None, None):
+                self._deltas[i] = delta_pixels
+                self._velocities[i] = roi.current_velocity
 
         if if_new_velo >0 :
             update_velo_plot = True
@@ -264,7 +401,14 @@ class FrameModel:
             update_average_velo = True
             
         print("time to process a frame: ", time.time() - time_1, "s")
-        return self.frame_count, self.roi_list, update_velo_plot, update_average_velo
+        return FrameResult(
+            self.frame_count,
+            self._deltas,
+            self._velocities,
+            timestamp,
+            update_velo_plot,
+            update_average_velo,
+        )
 
     def get_frame_count(self) -> int:
         """
@@ -277,6 +421,17 @@ class FrameModel:
         """
         return self.frame_count
 
+    def _init_frame_history(self) -> None:
+        """
+        Allocate the frame number and timestamp buffers of the frame history.
+        """
+        self._fn_buf = np.empty(1024, dtype=np.int64)
+        self._ts_buf = np.empty(1024, dtype="S23")
+
+    @property
+    def frame_history(self) -> list:
+        return self.get_frame_history()
+
     def get_frame_history(self) -> list:
         """
         Return the history of processed frames.
@@ -286,7 +441,13 @@ class FrameModel:
         list
             A list of dictionaries containing information about each processed frame.
         """
-        return self.frame_history
+        n = self.frame_count
+        return [
+            {"frame_number": frame_number, "timestamp": timestamp.decode()}
+            for frame_number, timestamp in zip(
+                self._fn_buf[:n].tolist(), self._ts_buf[:n].tolist()
+            )
+        ]
 
     def get_current_time(self) -> str:
         """
@@ -297,7 +458,31 @@ class FrameModel:
         str
             The current time as a string.
         """
-        return datetime.now().strftime("%d/%m/%Y %H:%M:%S.%f")[:-3]
+        t = time.time()
+        sec = int(t)
+        if sec != self._cached_sec:
+            self._cached_sec = sec
+            self._cached_prefix = time.strftime(
+                "%d/%m/%Y %H:%M:%S", time.localtime(sec)
+            )
+        return f"{self._cached_prefix}.{int((t - sec) * 1000):03d}"
+
+    def get_current_timestamp(self) -> str:
+        """
+        Return the current time in the format HH:MM:SS.
+
+        The string is only rebuilt when the integer second changes.
+
+        Returns
+        -------
+        str
+            The current time as a string.
+        """
+        sec = int(time.time())
+        if sec != self._last_sec_int:
+            self._last_sec_int = sec
+            self._last_sec_str = time.strftime("%H:%M:%S", time.localtime(sec))
+        return self._last_sec_str
 
     def get_px_to_mm(self, px_ratio: float) -> None:
         """
@@ -323,6 +508,36 @@ class FrameModel:
     def add_roi(self, roi):
         new_roi = ROI(roi, self.px2mm, self.degree)
         self.roi_list.append(new_roi)
+        self._roi_coords = np.vstack(
+            [self._roi_coords, np.asarray(roi[:4], dtype=np.int32)]
+        )
+        self._deltas = np.vstack([self._deltas, np.full((1, 2), np.nan, np.float32)])
+        self._velocities = np.append(self._velocities, np.float32(0.0))
+        self._update_roi_bounds()
+
+    def _update_roi_bounds(self) -> None:
+        """
+        Convert the (x, y, width, height) ROI rows to (x1, y1, x2, y2) bounds clipped
+        to the frame, and keep only the ROIs that still have a non-empty area.
+
+        Until the first frame arrives the frame shape is unknown and the bounds
+        are left unclipped; they are recomputed when the shape is known.
+        """
+        bounds = self._roi_coords.copy()
+        bounds[:, 2:] += bounds[:, :2]
+        if self._frame_shape is not None:
+            frame_height, frame_width = self._frame_shape
+            np.clip(bounds[:, 0::2], 0, frame_width, out=bounds[:, 0::2])
+            np.clip(bounds[:, 1::2], 0, frame_height, out=bounds[:, 1::2])
+        valid = np.flatnonzero(
+            (bounds[:, 2] > bounds[:, 0]) & (bounds[:, 3] > bounds[:, 1])
+        )
+
+        self._active_idx = valid.tolist()
+        self._active_rois = [self.roi_list[i] for i in self._active_idx]
+        self._roi_bounds = bounds[valid].tolist()
+        for roi, (x1, y1, x2, y2) in zip(self._active_rois, self._roi_bounds):
+            roi._slice_yx = (slice(y1, y2), slice(x1, x2))
 
     def delete_last_roi(self):
         """
@@ -338,10 +553,18 @@ class FrameModel:
 
         # Remove the last ROI from the list
         self.roi_list.pop()
+        self._roi_coords = self._roi_coords[:-1]
+        self._deltas = self._deltas[:-1]
+        self._velocities = self._velocities[:-1]
+        self._update_roi_bounds()
 
         return True
 
     def reset(self):
         self.frame_count = 0
-        self.frame_history = []
-        self.roi_list = []
\ No newline at end of file
+        self._init_frame_history()
+        self.roi_list = []
+        self._roi_coords = np.empty((0, 4), dtype=np.int32)
+        self._deltas = np.full((0, 2), np.nan, dtype=np.float32)
+        self._velocities = np.zeros(0, dtype=np.float32)
+        self._update_roi_bounds()
\ No newline at end of file
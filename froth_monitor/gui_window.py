@@ -16,19 +16,326 @@ from PySide6.QtWidgets import (
     QVBoxLayout,
     QHBoxLayout,
     QGridLayout,
-    QLineEdit,
     QRadioButton,
     QFrame,
     QGroupBox,
     QToolButton,
-    QSpinBox
+    QSpinBox,
+    QDoubleSpinBox,
+    QAbstractSpinBox,
+    QStackedWidget,
+    QSizePolicy,
+    QTableWidget,
+    QTableWidgetItem,
+    QAbstractItemView,
 )
-from PySide6.QtCore import Qt, QSize
-from PySide6.QtGui import QIcon, QFont, QColor
-import pyqtgraph as pg
+from PySide6.QtCore import Qt, QRect, QSize, QTimer, Slot
+from PySide6.QtGui import QIcon, QFont, QColor, QOpenGLContext, QImage, QPainter, QPixmap, QSurfaceFormat
+from PySide6.QtSvg import QSvgRenderer
 import sys
+import math
+import functools
 import numpy as np
 import os
+from typing import TYPE_CHECKING, Callable
+
+if TYPE_CHECKING:
+    # pyqtgraph is imported when the graph widgets are first built
+    import pyqtgraph as pg
+
+# Registers the ":/icons" resource prefix; see resources/resources.qrc
+from froth_monitor import resources_rc  # noqa: F401
+
+
+# Default overflow direction in radians (pointing up, -90 degrees)
+DEFAULT_ARROW_ANGLE = -math.pi / 2
+
+# Number of most recent velocity samples shown per ROI in the velocity plot
+VELOCITY_PLOT_WINDOW = 30
+
+# Size (width, height) of the video canvas; frames are resized to fit it once,
+# before they are analysed and displayed
+VIDEO_CANVAS_SIZE = (700, 400)
+
+# Qt values shared by several widgets
+_STATIC_CONTENTS = Qt.WidgetAttribute.WA_StaticContents
+_ALIGN_CENTER = Qt.AlignmentFlag.AlignCenter
+_ALIGN_LEFT = Qt.AlignmentFlag.AlignLeft
+_ICON_SIZE_24 = QSize(24, 24)
+_POLICY_IGNORED_FIXED = QSizePolicy(QSizePolicy.Policy.Ignored, QSizePolicy.Policy.Fixed)
+
+# Stylesheet for the whole main window. It is parsed once when the window is
+# created rather than once per widget; widgets pick a variant by objectName.
+STYLESHEET = """
+QWidget {
+    background-color: #f0f0f0;
+}
+#headerBar, #headerBar * {
+    background-color: #3c4043;
+    color: white;
+}
+#titleLabel {
+    font-size: 24px;
+    font-weight: bold;
+}
+#content, #content * {
+    background-color: #f0f0f0;
+    font-weight: bold;
+    font-size: 16px;
+    color: black;
+}
+#content QRadioButton {
+    font-weight: normal;
+    font-size: 14px;
+}
+#content QPushButton {
+    background-color: #4285f4;
+    color: white;
+    font-size: 14px;
+    padding: 8px;
+    border-radius: 4px;
+}
+#content QPushButton:hover {
+    background-color: #3367d6;
+}
+#content QPushButton#compactButton {
+    font-size: 12px;
+}
+#content QPushButton#roiButton {
+    font-size: 18px;
+    padding: 5px;
+}
+#content QPushButton#resetButton {
+    padding: 5px;
+}
+#content QPushButton#dangerButton {
+    background-color: red;
+    font-size: 15px;
+    padding: 5px;
+}
+#content QPushButton#dangerButton:hover {
+    background-color: #3367d6;
+}
+#content QSpinBox, #content QSpinBox * {
+    background-color: white;
+    font-size: 12px;
+    padding: 5px;
+    border-radius: 4px;
+}
+#content QLineEdit {
+    background-color: white;
+    font-size: 10px;
+    padding: 8px;
+    border-radius: 4px;
+}
+#content QDoubleSpinBox {
+    background-color: white;
+    font-size: 10px;
+    padding: 6px 0px 7px 0px;
+    border: none;
+    border-radius: 4px;
+}
+#content QDoubleSpinBox QLineEdit {
+    padding: 0px;
+}
+#content QDoubleSpinBox::up-button, #content QDoubleSpinBox::down-button {
+    subcontrol-origin: border;
+    width: 0px;
+    border: none;
+    image: none;
+}
+#content QLabel#badgeLabel, #content QLabel#roiLabel {
+    background-color: #3c4043;
+    color: white;
+    font-size: 12px;
+    padding: 8px;
+    border-radius: 4px;
+}
+#content QLabel#roiLabel {
+    font-size: 14px;
+}
+#content QLabel#unitLabel {
+    font-size: 8px;
+}
+#content QLabel#captionLabel {
+    font-size: 10px;
+    color: #333333;
+}
+#content QFrame#separator {
+    background-color: #3c4043;
+}
+#videoContainer, #videoContainer * {
+    background-color: #333333;
+    border-radius: 4px;
+}
+"""
+
+
+@functools.lru_cache(maxsize=None)
+def resource_path(relative_path: str) -> str:
+    """Return the path of a bundled resource, resolving PyInstaller's _MEIPASS."""
+    if hasattr(sys, '_MEIPASS'):
+        return os.path.join(sys._MEIPASS, relative_path) # type: ignore
+    return relative_path
+
+
+def disable_vsync() -> None:
+    """
+    Don't wait for v-blank on OpenGL surfaces (the velocity plot when OpenGL is
+    available); plot updates are already throttled by the window.
+
+    Must be called before the QApplication is created.
+    """
+    fmt = QSurfaceFormat.defaultFormat()
+    fmt.setSwapInterval(0)
+    QSurfaceFormat.setDefaultFormat(fmt)
+
+
+def opengl_available() -> bool:
+    """Return True if an OpenGL context can be created on the current platform."""
+    return QOpenGLContext().create()
+
+
+class IconCache:
+    """
+    Lazily loaded, shared QIcon instances for the button icons.
+
+    The icons are compiled into resources_rc (regenerate it with
+    ``pyside6-rcc froth_monitor/resources/resources.qrc -o froth_monitor/resources_rc.py``),
+    so they are read from memory rather than from the working directory. Each
+    icon is rendered once to a 24x24 pixmap (the only size the buttons use) the
+    first time it is requested, and the same QIcon object is returned afterwards.
+    """
+
+    _camera: QIcon | None = None
+    _pause: QIcon | None = None
+    _play: QIcon | None = None
+
+    @staticmethod
+    def _rasterize(path: str) -> QIcon:
+        renderer = QSvgRenderer(path)
+        pixmap = QPixmap(_ICON_SIZE_24)
+        pixmap.fill(Qt.GlobalColor.transparent)
+        painter = QPainter(pixmap)
+        renderer.render(painter)
+        painter.end()
+        return QIcon(pixmap)
+
+    @classmethod
+    def camera(cls) -> QIcon:
+        if cls._camera is None:
+            cls._camera = cls._rasterize(":/icons/camera_icon.svg")
+        return cls._camera
+
+    @classmethod
+    def pause(cls) -> QIcon:
+        if cls._pause is None:
+            cls._pause = cls._rasterize(":/icons/pause_icon.svg")
+        return cls._pause
+
+    @classmethod
+    def play(cls) -> QIcon:
+        if cls._play is None:
+            cls._play = cls._rasterize(":/icons/play_icon.svg")
+        return cls._play
+
+
+class DeferredWidget(QStackedWidget):
+    """
+    A container that builds its content the first time it is shown.
+
+    Until then it only holds an empty placeholder, so expensive widgets (such as
+    the pyqtgraph plot) are not constructed while the rest of the window is set up.
+    """
+
+    def __init__(self, build: Callable[[], QWidget]) -> None:
+        super().__init__()
+        self._build: Callable[[], QWidget] | None = build
+        self.addWidget(QWidget())
+
+    def ensure_built(self) -> None:
+        """Build the content now if it has not been built yet."""
+        if self._build is None:
+            return
+        build, self._build = self._build, None
+        self.addWidget(build())
+        self.setCurrentIndex(1)
+
+    def showEvent(self, event) -> None:
+        self.ensure_built()
+        super().showEvent(event)
+
+
+class VideoCanvas(QWidget):
+    """
+    Video display that paints the latest frame image directly.
+
+    A QLabel needs every frame converted to a QPixmap before it can show it. This
+    widget keeps the QImage and draws it centered in paintEvent instead, so a
+    frame is only converted once, while painting.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._image: QImage | None = None
+        self._frame: np.ndarray | None = None
+
+    def image_rect(self, size: QSize) -> QRect:
+        """
+        Return where an image of the given size is drawn, centered in the canvas.
+
+        The ROI overlay is placed with the same rectangle, so drawn ROIs line up
+        with the frame pixels they analyse.
+        """
+        return QRect(
+            (self.width() - size.width()) // 2,
+            (self.height() - size.height()) // 2,
+            size.width(),
+            size.height(),
+        )
+
+    def set_image(self, image: QImage) -> None:
+        """
+        Show an image and schedule a repaint.
+
+        Args:
+            image: The frame to show. It must own its pixel data, since it is kept
+                until the next frame arrives.
+        """
+        self._image = image
+        self._frame = None
+        self.update()
+
+    def set_frame(self, frame: np.ndarray) -> None:
+        """
+        Show a BGR frame without copying or converting its pixels.
+
+        The QImage wraps the array's buffer, and the array is kept until the next
+        frame arrives so the buffer outlives the image. The BGR to RGB conversion
+        happens when the frame is painted, so frames replaced before the next
+        repaint are never converted.
+
+        Args:
+            frame: An (h, w, 3) uint8 BGR array, as read by OpenCV, whose rows
+                are contiguous.
+        """
+        h, w = frame.shape[:2]
+        self._frame = frame
+        self._image = QImage(frame.data, w, h, frame.strides[0], QImage.Format.Format_BGR888)
+        self.update()
+
+    def clear(self) -> None:
+        """Remove the current image."""
+        self._image = None
+        self._frame = None
+        self.update()
+
+    def paintEvent(self, event) -> None:
+        if self._image is None:
+            return
+        painter = QPainter(self)
+        painter.drawImage(self.image_rect(self._image.size()).topLeft(), self._image)
+        painter.end()
 
 
 class MainGUIWindow(QMainWindow):
@@ -51,11 +358,14 @@ class MainGUIWindow(QMainWindow):
         """
         super(MainGUIWindow, self).__init__()
         self.setWindowTitle("Froth Monitor")
+        # No dock widgets are used, so turn off dock animation and tabbing
+        self.setDockOptions(QMainWindow.DockOption(0))
+        self.setDockNestingEnabled(False)
         self.setGeometry(100, 100, 1000, 800)
-        self.setStyleSheet("background-color: #f0f0f0;")
+        self.setStyleSheet(STYLESHEET)
 
         # Initialize default arrow angle (90 degrees)
-        self.arrow_angle = -np.pi / 2
+        self.arrow_angle = DEFAULT_ARROW_ANGLE
         # Initialize default px2mm value (1.0)
         self.px2mm = 1.0
 
@@ -63,6 +373,20 @@ class MainGUIWindow(QMainWindow):
         self.overlay_widget = None
         self.video_rect = None
 
+        # Velocity plot curves keyed by ROI index, with their y-value buffers.
+        # The x positions are shared by all curves
+        self.velocity_curves: dict[int, "pg.PlotCurveItem"] = {}
+        self._velocity_y_bufs: dict[int, np.ndarray] = {}
+        self._velocity_x = np.arange(VELOCITY_PLOT_WINDOW, dtype=np.float32)
+
+        # Curve updates scheduled with schedule_plot_update are coalesced and
+        # applied at most once per screen refresh
+        self._pending_curves: dict[int, tuple[list, str]] = {}
+        self._graph_timer = QTimer(self)
+        self._graph_timer.setSingleShot(True)
+        self._graph_timer.setInterval(int(1000 / max(30.0, self.screen().refreshRate())))
+        self._graph_timer.timeout.connect(self._flush_graph)
+
         # Define UI elements
         self.initUI()
 
@@ -74,8 +398,14 @@ class MainGUIWindow(QMainWindow):
         for creating different parts of the UI, including the header bar, left panel controls,
         and right panel with video canvas and graph display.
         """
+        # Suspend updates while the widget tree is built so it is laid out and
+        # painted once, when updates are enabled again at the end
+        self.setUpdatesEnabled(False)
+
         # Main widget and layout
         main_widget = QWidget(self)
+        # The header and content widgets cover the whole central widget
+        main_widget.setAttribute(Qt.WidgetAttribute.WA_OpaquePaintEvent, True)
         self.setCentralWidget(main_widget)
         main_layout = QVBoxLayout()
         main_layout.setContentsMargins(0, 0, 0, 0)
@@ -88,8 +418,7 @@ class MainGUIWindow(QMainWindow):
         
         # Main content area
         content_widget = QWidget()
-        content_widget.setStyleSheet("background-color: #f0f0f0; font-weight: bold; font-size: 16px; \
-            color: black")
+        content_widget.setObjectName("content")
         content_layout = QHBoxLayout(content_widget)
         content_layout.setContentsMargins(10, 10, 10, 10)
         main_layout.addWidget(content_widget)
@@ -104,22 +433,24 @@ class MainGUIWindow(QMainWindow):
         content_layout.addWidget(left_panel)
         content_layout.addWidget(right_panel)
 
-    def _create_header_bar(self) -> QFrame:
+        self.setUpdatesEnabled(True)
+
+    def _create_header_bar(self) -> QWidget:
         """
         Create the header bar with title.
         
         Returns:
-            QFrame: The header bar widget.
+            QWidget: The header bar widget.
         """
-        header_bar = QFrame()
-        header_bar.setStyleSheet("background-color: #3c4043; color: white;")
+        header_bar = QWidget()
+        header_bar.setObjectName("headerBar")
         header_bar.setFixedHeight(50)
         header_layout = QHBoxLayout(header_bar)
         header_layout.setContentsMargins(20, 0, 20, 0)
         
         # Add title to header
         title_label = QLabel("Froth Monitor")
-        title_label.setStyleSheet("color: white; font-size: 24px; font-weight: bold;")
+        title_label.setObjectName("titleLabel")
         header_layout.addWidget(title_label)
         
         # Add spacer to push window controls to the right
@@ -127,16 +458,15 @@ class MainGUIWindow(QMainWindow):
         
         return header_bar
 
-    def _create_left_panel(self) -> QFrame:
+    def _create_left_panel(self) -> QWidget:
         """
         Create the left panel with all control elements.
         
         Returns:
-            QFrame: The left panel widget with all controls.
+            QWidget: The left panel widget with all controls.
         """
-        left_panel = QFrame()
+        left_panel = QWidget()
         left_panel.setFixedWidth(250)
-        left_panel.setStyleSheet("background-color: #f0f0f0;")
         left_layout = QVBoxLayout(left_panel)
         left_layout.setSpacing(15)
         left_layout.setContentsMargins(10, 10, 10, 10)
@@ -172,31 +502,15 @@ class MainGUIWindow(QMainWindow):
             QGroupBox: The video source group box with radio buttons.
         """
         source_group = QGroupBox("Video Source")
-        source_group.setStyleSheet("font-weight: bold; font-size: 16px; color: black")
+        source_group.setAttribute(_STATIC_CONTENTS)
         source_layout = QVBoxLayout(source_group)
         source_layout.setSpacing(10)
         
         # Radio buttons for video source
         self.webcam_radio = QRadioButton("Webcam")
-        self.webcam_radio.setStyleSheet("font-weight: normal; font-size: 14px; color: black")
         self.prerecorded_radio = QRadioButton("Pre-recorded")
-        self.prerecorded_radio.setStyleSheet("font-weight: normal; font-size: 14px; color: black")
         self.webcam_radio.setChecked(True)
         self.import_button = QPushButton("Import")
-        self.import_button.setStyleSheet(
-            """
-            QPushButton {
-                background-color: #4285f4;
-                color: white;
-                font-size: 14px;
-                padding: 8px;
-                border-radius: 4px;
-            }
-            QPushButton:hover {
-                background-color: #3367d6;
-            }
-            """
-        )
         source_layout.addWidget(self.webcam_radio)
         source_layout.addWidget(self.prerecorded_radio)
         source_layout.addWidget(self.import_button)
@@ -211,151 +525,90 @@ class MainGUIWindow(QMainWindow):
             QGroupBox: The calibration group box with button and text input.
         """
         calibration_group = QGroupBox("Calibration/ROI")
-        calibration_group.setStyleSheet("font-weight: bold; font-size: 16px; \
-            color: black")
-        calibration_layout = QVBoxLayout(calibration_group)
+        calibration_group.setAttribute(_STATIC_CONTENTS)
+        calibration_layout = QGridLayout(calibration_group)
         calibration_layout.setSpacing(10)
 
-        roi_layout = QVBoxLayout()
-        roi_layout_1 = QHBoxLayout()
-
         #---------Ruler draw sector 1
         self.calibration_button = QPushButton("Draw a line with \n length of")
-        self.calibration_button.setStyleSheet(
-            """
-            QPushButton {
-                background-color: #4285f4;
-                color: white;
-                font-size: 12px;
-                padding: 8px;
-                border-radius: 4px;
-            }
-            QPushButton:hover {
-                background-color: #3367d6;
-            }
-            """
-        )
+        self.calibration_button.setObjectName("compactButton")
         self.calibration_button.setFixedWidth(120)  # Fixed width for the button
 
         self.px2mm_spinbox = QSpinBox()
         self.px2mm_spinbox.setRange(1, 1000)  # Adjust the range as needed
         self.px2mm_spinbox.setValue(20)  # Default value
-        self.px2mm_spinbox.setStyleSheet(
-            "background-color: white; font-size: 12px; padding: 5px; border-radius: 4px;"
-        )
+        self.px2mm_spinbox.setSizePolicy(_POLICY_IGNORED_FIXED)
 
         px2mm_label = QLabel("mm")
-        px2mm_label.setStyleSheet(
-            "color: black; font-size: 8px;"
-        )
-
-        roi_layout_1.addWidget(self.calibration_button)
-        roi_layout_1.addWidget(self.px2mm_spinbox)
-        roi_layout_1.addWidget(px2mm_label)
+        px2mm_label.setObjectName("unitLabel")
 
         #---------Ruler draw sector 2
-        roi_layout_2 = QHBoxLayout()
         px2mm_label_2 = QLabel("Result ratio \n(edible):")
-        px2mm_label_2.setStyleSheet(
-                "\
-                background-color: #3c4043;\
-                color: white;\
-                font-size: 12px;\
-                padding: 8px;\
-                border-radius: 4px;\
-                "
-        )
-        px2mm_label_2.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        px2mm_label_2.setObjectName("badgeLabel")
+        px2mm_label_2.setAlignment(_ALIGN_CENTER)
         px2mm_label_2.setFixedWidth(120)
 
-        self.px2mm_result_textbox = QLineEdit()
-        self.px2mm_result_textbox.setText("1.0")  # Default value
-        self.px2mm_result_textbox.setStyleSheet(
-            "background-color: white; font-size: 10px; padding: 8px; border-radius: 4px;"
-        )
-        self.px2mm_result_textbox.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.px2mm_result_textbox = QDoubleSpinBox()
+        self.px2mm_result_textbox.setButtonSymbols(QAbstractSpinBox.ButtonSymbols.NoButtons)
+        self.px2mm_result_textbox.setDecimals(2)
+        self.px2mm_result_textbox.setRange(0.01, 1e6)  # Smallest non-zero value at 2 decimals
+        self.px2mm_result_textbox.setValue(self.px2mm)  # Default value
+        self.px2mm_result_textbox.setAlignment(_ALIGN_CENTER)
+        self.px2mm_result_textbox.setSizePolicy(_POLICY_IGNORED_FIXED)
+        self.px2mm_result_textbox.valueChanged.connect(self._set_px2mm)
 
         px2mm_label_3 = QLabel("px/mm")
-        px2mm_label_3.setStyleSheet(
-            "color: black; font-size: 8px;"
-        )
-
-        roi_layout_2.addWidget(px2mm_label_2)
-        roi_layout_2.addWidget(self.px2mm_result_textbox)
-        roi_layout_2.addWidget(px2mm_label_3)
-
-        roi_layout.addLayout(roi_layout_1)
-        roi_layout.addLayout(roi_layout_2)
+        px2mm_label_3.setObjectName("unitLabel")
 
         # Separator line
         separator_1 = QFrame()
         separator_1.setFrameShape(QFrame.Shape.HLine)
         separator_1.setFrameShadow(QFrame.Shadow.Sunken)
-        separator_1.setStyleSheet("background-color: #3c4043;")
+        separator_1.setObjectName("separator")
 
         # Arrow Sector
-        arrow_layout = QHBoxLayout()
         self.add_arrow_button = QPushButton("Draw Arrow")
-        self.add_arrow_button.setStyleSheet(
-            """
-            QPushButton {
-                background-color: #4285f4;
-                color: white;
-                font-size: 12px;
-                padding: 8px;
-                border-radius: 4px;
-            }
-            QPushButton:hover {
-                background-color: #3367d6;
-            }
-            """
-        )
+        self.add_arrow_button.setObjectName("compactButton")
         self.add_arrow_button.setFixedWidth(120)
         
-        self.direction_textbox = QLineEdit()
-        self.direction_textbox.setText("-90.0")  # Default value
-        self.direction_textbox.setStyleSheet(
-            "background-color: white; font-size: 10px; padding: 8px; border-radius: 4px;"
-        )
-        self.direction_textbox.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.direction_textbox = QDoubleSpinBox()
+        self.direction_textbox.setButtonSymbols(QAbstractSpinBox.ButtonSymbols.NoButtons)
+        self.direction_textbox.setDecimals(1)
+        self.direction_textbox.setRange(-360.0, 360.0)
+        self.direction_textbox.setValue(math.degrees(self.arrow_angle))  # Default value
+        self.direction_textbox.setAlignment(_ALIGN_CENTER)
+        self.direction_textbox.setSizePolicy(_POLICY_IGNORED_FIXED)
+        self.direction_textbox.valueChanged.connect(self._set_arrow_angle)
         degree_label = QLabel("degree")
-        degree_label.setStyleSheet(
-            "color: black; font-size: 8px;"
-        )
-
-        # Separator line
-        separator_2 = QFrame()
-        separator_2.setFrameShape(QFrame.Shape.HLine)
-        separator_2.setFrameShadow(QFrame.Shadow.Sunken)
-        separator_2.setStyleSheet("background-color: #3c4043;")
+        degree_label.setObjectName("unitLabel")
 
         self.confirm_arrow_button = QPushButton("Confirm calibration")
-        self.confirm_arrow_button.setStyleSheet(
-            """
-            QPushButton {
-                background-color: #4285f4;
-                color: white;
-                font-size: 14px;
-                padding: 8px;
-                border-radius: 4px;
-            }
-            QPushButton:hover {
-                background-color: #3367d6;
-            }
-            """
-        )
-        arrow_layout.addWidget(self.add_arrow_button)
-        arrow_layout.addWidget(self.direction_textbox)
-        arrow_layout.addWidget(degree_label)
 
-        calibration_layout.addLayout(roi_layout)
-        calibration_layout.addWidget(separator_1)
-        calibration_layout.addLayout(arrow_layout)
-        # calibration_layout.addWidget(separator_2)
-        calibration_layout.addWidget(self.confirm_arrow_button)
+        # One grid instead of nested box layouts: button | input | unit
+        calibration_layout.addWidget(self.calibration_button, 0, 0)
+        calibration_layout.addWidget(self.px2mm_spinbox, 0, 1)
+        calibration_layout.addWidget(px2mm_label, 0, 2)
+        calibration_layout.addWidget(px2mm_label_2, 1, 0)
+        calibration_layout.addWidget(self.px2mm_result_textbox, 1, 1)
+        calibration_layout.addWidget(px2mm_label_3, 1, 2)
+        calibration_layout.addWidget(separator_1, 2, 0, 1, 3)
+        calibration_layout.addWidget(self.add_arrow_button, 3, 0)
+        calibration_layout.addWidget(self.direction_textbox, 3, 1)
+        calibration_layout.addWidget(degree_label, 3, 2)
+        calibration_layout.addWidget(self.confirm_arrow_button, 4, 0, 1, 3)
 
         return calibration_group
 
+    @Slot(float)
+    def _set_px2mm(self, value: float) -> None:
+        """Keep px2mm in sync with the px/mm ratio box."""
+        self.px2mm = value
+
+    @Slot(float)
+    def _set_arrow_angle(self, value: float) -> None:
+        """Keep arrow_angle (radians) in sync with the direction box (degrees)."""
+        self.arrow_angle = math.radians(value)
+
     def _create_roi_controls(self) -> QGroupBox:
         """
         Create the ROI (Region of Interest) controls.
@@ -364,44 +617,21 @@ class MainGUIWindow(QMainWindow):
             QGroupBox: The ROI group box with add and delete buttons.
         """
         roi_group = QGroupBox()
-        roi_group.setStyleSheet("font-weight: bold; font-size: 16px; color: black")
+        roi_group.setAttribute(_STATIC_CONTENTS)
         roi_layout = QHBoxLayout(roi_group)
         
         # Add spacer to push buttons to the right
         # roi_layout.addStretch()
         self.roi_text = QLabel("ROI")
-        self.roi_text.setStyleSheet(
-            "background-color: #3c4043; color: white; font-size: 14px; \
-            font-weight: bold; padding: 8px; border-radius: 4px;"
-        )
+        self.roi_text.setObjectName("roiLabel")
 
         # Add + and - buttons for ROI
         self.add_roi_button = QPushButton("+")
-        self.add_roi_button.setStyleSheet(
-            """
-            QPushButton {
-                background-color: #4285f4; color: white; font-size: 18px; \
-            font-weight: bold; padding: 5px; border-radius: 4px;
-            }
-            QPushButton:hover {
-                background-color: #3367d6;
-            }
-            """
-        )
+        self.add_roi_button.setObjectName("roiButton")
         self.add_roi_button.setFixedSize(40, 40)
         
         self.delete_roi_button = QPushButton("-")
-        self.delete_roi_button.setStyleSheet(
-            """
-            QPushButton {
-                background-color: #4285f4; color: white; font-size: 18px; \
-            font-weight: bold; padding: 5px; border-radius: 4px;
-            }
-            QPushButton:hover {
-                background-color: #3367d6;
-            }
-            """
-        )
+        self.delete_roi_button.setObjectName("roiButton")
         self.delete_roi_button.setFixedSize(40, 40)
         
         roi_layout.addWidget(self.roi_text)
@@ -413,9 +643,7 @@ class MainGUIWindow(QMainWindow):
         # Helper to get resource path
     
     def resource_path(self,relative_path):
-        if hasattr(sys, '_MEIPASS'):
-            return os.path.join(sys._MEIPASS, relative_path) # type: ignore
-        return relative_path
+        return resource_path(relative_path)
         
     def _add_reset_buttons(self, layout: QVBoxLayout) -> None:
         """
@@ -428,42 +656,25 @@ class MainGUIWindow(QMainWindow):
 
         # Reset button with camera icon
         self.record_button = QPushButton("  Start Recording")
-        self.record_button.setIcon(QIcon(self.resource_path("froth_monitor/resources/camera_icon.ico")))
-        self.record_button.setIconSize(QSize(24, 24))
-        self.record_button.setStyleSheet(
-            "QPushButton {\
-                background-color: red; color: white; font-size: 15px; \
-                padding: 5px; border-radius: 4px;\
-            }\
-            QPushButton:hover {\
-                background-color: #3367d6;\
-            }"
-        )
+        self.record_button.setIcon(IconCache.camera())
+        self.record_button.setIconSize(_ICON_SIZE_24)
+        self.record_button.setObjectName("dangerButton")
         self.record_button.setFixedHeight(50)
         layout.addWidget(self.record_button)
         
         # Simple Reset button (as shown in the image)
         self.simple_reset_button = QPushButton("Reset")
-        self.simple_reset_button.setStyleSheet(
-            "QPushButton {\
-                background-color: #4285f4; color: white; font-size: 14px; \
-                padding: 5px; border-radius: 4px;\
-            }\
-            QPushButton:hover {\
-                background-color: #3367d6;\
-            }"
-        )
+        self.simple_reset_button.setObjectName("resetButton")
         layout.addWidget(self.simple_reset_button)
 
-    def _create_right_panel(self) -> QFrame:
+    def _create_right_panel(self) -> QWidget:
         """
         Create the right panel with video canvas and graph display.
         
         Returns:
-            QFrame: The right panel widget with video and graph components.
+            QWidget: The right panel widget with video and graph components.
         """
-        right_panel = QFrame()
-        right_panel.setStyleSheet("background-color: #f0f0f0;")
+        right_panel = QWidget()
         right_layout = QVBoxLayout(right_panel)
         right_layout.setSpacing(10)
         
@@ -478,20 +689,26 @@ class MainGUIWindow(QMainWindow):
     def _create_video_canvas(self, layout: QVBoxLayout) -> None:
         """
         Create the video canvas and add it to the given layout.
+
+        The canvas is VIDEO_CANVAS_SIZE and never scales frames itself: callers
+        resize each frame to fit it once, before analysing it, and pass that same
+        frame to VideoCanvas.set_frame.
         
         Args:
             layout: The layout to add the video canvas to.
         """
         self.video_container = QWidget()
-        self.video_container.setFixedSize(700, 400)
-        self.video_container.setStyleSheet("background-color: #333333; border-radius: 4px;")
+        self.video_container.setFixedSize(*VIDEO_CANVAS_SIZE)
+        self.video_container.setObjectName("videoContainer")
         video_container_layout = QVBoxLayout(self.video_container)
-        
-        # Create the video canvas label
-        self.video_canvas_label = QLabel("")
-        self.video_canvas_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.video_canvas_label.setStyleSheet("background-color: #333333;")
-        self.video_canvas_label.setGeometry(0, 0, 700, 400)
+        video_container_layout.setContentsMargins(0, 0, 0, 0)
+        
+        # Create the video canvas. It fills the container, so its coordinates
+        # match those of the overlay drawn on the container, and its fixed size
+        # is already known before the window is shown and is not changed by the
+        # layout when frames arrive
+        self.video_canvas_label = VideoCanvas()
+        self.video_canvas_label.setFixedSize(*VIDEO_CANVAS_SIZE)
         video_container_layout.addWidget(self.video_canvas_label)
         
         layout.addWidget(self.video_container)
@@ -507,43 +724,17 @@ class MainGUIWindow(QMainWindow):
             QGroupBox: The calibration group box with button and text input.
         """
         export_group = QGroupBox("Export Settings")
-        export_group.setStyleSheet("font-weight: bold; font-size: 16px; color: black")
+        export_group.setAttribute(_STATIC_CONTENTS)
         export_layout = QVBoxLayout(export_group)
         export_layout.setSpacing(10)
 
         # roi_layout = QHBoxLayout()
         self.export_button = QPushButton("Export/Recording Settings")
-        self.export_button.setStyleSheet(
-            """
-            QPushButton {
-                background-color: #4285f4;
-                color: white;
-                font-size: 12px;
-                padding: 8px;
-                border-radius: 4px;
-            }
-            QPushButton:hover {
-                background-color: #3367d6;
-            }
-            """
-        )
+        self.export_button.setObjectName("compactButton")
         # self.calibration_button.setFixedWidth(100)
         
         self.save_button = QPushButton("Save")
-        self.save_button.setStyleSheet(
-            """
-            QPushButton {
-                background-color: #4285f4;
-                color: white;
-                font-size: 12px;
-                padding: 8px;
-                border-radius: 4px;
-            }
-            QPushButton:hover {
-                background-color: #3367d6;
-            }
-            """
-        )
+        self.save_button.setObjectName("compactButton")
         export_layout.addWidget(self.export_button)
         export_layout.addWidget(self.save_button)
         
@@ -558,46 +749,181 @@ class MainGUIWindow(QMainWindow):
         """
         # Velocity vs Time label
         velocity_label = QLabel("Velocity vs Time")
-        velocity_label.setStyleSheet("font-weight: bold; font-size: 16px; \
-            color: black")
         layout.addWidget(velocity_label)
-        
-        horizontal_layout = QHBoxLayout()
-
-
-        example_1d_data = ["N/A"]
-        # ROI Movements Table
-        self.table_widget = pg.TableWidget()
-        self.table_widget.setData(example_1d_data)
-        # self.table_widget.setColumnCount(2)
-        self.table_widget.setHorizontalHeaderLabels(["mean_velocity  "])
-        self.table_widget.setFormat("%.2f")
-        self.table_widget.setColumnWidth(0, 120)
-        # self.table_widget.setColumnWidth(1, 100)
-        self.table_widget.setFixedHeight(200)
 
+        # The table and plot are built when the container is first shown
+        self._table_widget = None
+        self._plot_widget = None
+        self._graph_container = DeferredWidget(self._build_graph_widgets)
+        self._graph_container.setFixedHeight(200)
+        layout.addWidget(self._graph_container)
 
-        # ROI Movements Canvas (graph)
-        self.plot_widget = pg.PlotWidget()
-        self.plot_widget.setBackground("white")
-        self.plot_widget.setFixedHeight(200)
-        self.plot_widget.showAxis("left")
-        self.plot_widget.showAxis("bottom")
-        self.plot_widget.setLabel("left", "Velocity", units="mm/s")
-        self.plot_widget.setLabel("bottom", "Time", units="secs")
-        self.plot_widget.addLegend()
-        horizontal_layout.addWidget(self.table_widget)
-        horizontal_layout.addWidget(self.plot_widget)
-        layout.addLayout(horizontal_layout)
-
-        # layout.addWidget(self.plot_widget)
-        
         # Add "Average 30 s" label
         avg_label = QLabel("Average over past 30s")
-        avg_label.setStyleSheet("font-size: 10px; color: #333333; text-align: left;")
-        avg_label.setAlignment(Qt.AlignmentFlag.AlignLeft)
+        avg_label.setObjectName("captionLabel")
+        avg_label.setAlignment(_ALIGN_LEFT)
         layout.addWidget(avg_label)
 
+    @property
+    def table_widget(self) -> QTableWidget:
+        """The average velocity table, built on first access if not shown yet."""
+        self._graph_container.ensure_built()
+        return self._table_widget
+
+    @property
+    def plot_widget(self) -> "pg.PlotWidget":
+        """The velocity plot, built on first access if not shown yet."""
+        self._graph_container.ensure_built()
+        return self._plot_widget
+
+    def _build_graph_widgets(self) -> QWidget:
+        """
+        Build the average velocity table and the velocity vs time plot.
+
+        Returns:
+            QWidget: The widget holding the table and the plot side by side.
+        """
+        import pyqtgraph as pg
+
+        graph_widget = QWidget()
+        horizontal_layout = QHBoxLayout(graph_widget)
+        horizontal_layout.setContentsMargins(0, 0, 0, 0)
+        horizontal_layout.setSpacing(10)
+
+        # ROI Movements Table: a plain QTableWidget with one row per ROI
+        self._table_widget = QTableWidget(1, 1)
+        self._table_widget.setHorizontalHeaderLabels(["mean_velocity  "])
+        self._table_widget.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self._table_widget.setVerticalScrollMode(QAbstractItemView.ScrollMode.ScrollPerPixel)
+        self._table_widget.setColumnWidth(0, 120)
+        self._table_widget.setFixedHeight(200)
+        self._table_widget.setItem(0, 0, QTableWidgetItem("N/A"))
+        # Size hint follows the contents and the plot takes the remaining width
+        self._table_widget.setSizeAdjustPolicy(QAbstractItemView.SizeAdjustPolicy.AdjustToContents)
+        self._table_widget.setSizePolicy(QSizePolicy.Policy.Preferred, QSizePolicy.Policy.Preferred)
+
+        # ROI Movements Canvas (graph)
+        # Draw curves without antialiasing and, where the platform provides an
+        # OpenGL context, let the view render through an OpenGL viewport so
+        # stroking the velocity curves is done on the GPU
+        pg.setConfigOptions(antialias=False, useOpenGL=opengl_available())
+        # The legend is only added once a second curve appears
+        self._plot_widget = pg.PlotWidget()
+        self._plot_widget.setBackground("white")
+        self._plot_widget.setFixedHeight(200)
+        self._plot_widget.showAxis("left")
+        self._plot_widget.showAxis("bottom")
+        self._plot_widget.setLabel("left", "Velocity", units="mm/s")
+        self._plot_widget.setLabel("bottom", "Time", units="secs")
+        # The x axis always shows the last VELOCITY_PLOT_WINDOW samples and the
+        # y range is set by rescale_y, so the view never scans the curves to
+        # auto-range and mouse panning/zooming (which would be reset on the
+        # next update) is off
+        self._plot_widget.disableAutoRange()
+        self._plot_widget.setXRange(0, VELOCITY_PLOT_WINDOW - 1)
+        self._plot_widget.setMouseEnabled(x=False, y=False)
+        self._plot_widget.hideButtons()
+        horizontal_layout.addWidget(self._table_widget)
+        horizontal_layout.addWidget(self._plot_widget)
+
+        return graph_widget
+
+    def set_mean_velocities(self, values: list) -> None:
+        """
+        Show the mean velocity of each ROI in the table.
+
+        Args:
+            values: One mean velocity per ROI, or None where it is not known yet.
+        """
+        table = self.table_widget
+        table.setRowCount(len(values))
+        for row, value in enumerate(values):
+            text = "N/A" if value is None else f"{value:.2f}"
+            item = table.item(row, 0)
+            if item is None:
+                table.setItem(row, 0, QTableWidgetItem(text))
+            else:
+                item.setText(text)
+
+    def set_velocity_curve(self, index: int, values: list, pen: str) -> None:
+        """
+        Plot the latest velocity values of one ROI, right-aligned in the plot window.
+
+        The curve for each ROI is created on first use and kept in the plot; later
+        calls only copy the values into its preallocated buffer and replace the
+        curve data.
+
+        Args:
+            index: Index of the ROI whose velocities are plotted.
+            values: The ROI's velocity history; only the last
+                VELOCITY_PLOT_WINDOW values are shown.
+            pen: Pen used when the curve is created.
+        """
+        if index not in self.velocity_curves:
+            import pyqtgraph as pg
+
+            curve = pg.PlotCurveItem(pen=pen, name=f"ROI {index + 1}", skipFiniteCheck=True)
+            if self.velocity_curves and self.plot_widget.plotItem.legend is None:
+                legend = self.plot_widget.addLegend()
+                for existing in self.velocity_curves.values():
+                    legend.addItem(existing, existing.name())
+            self.plot_widget.addItem(curve)
+            self.velocity_curves[index] = curve
+            self._velocity_y_bufs[index] = np.empty(VELOCITY_PLOT_WINDOW, dtype=np.float32)
+
+        count = min(len(values), VELOCITY_PLOT_WINDOW)
+        start = VELOCITY_PLOT_WINDOW - count
+        y_buf = self._velocity_y_bufs[index]
+        if count:
+            y_buf[start:] = values[-count:]
+        self.velocity_curves[index].setData(self._velocity_x[start:], y_buf[start:])
+
+    def rescale_y(self, ymin: float, ymax: float) -> None:
+        """
+        Set the velocity axis range of the plot.
+
+        Args:
+            ymin: Lowest velocity shown.
+            ymax: Highest velocity shown.
+        """
+        self.plot_widget.setYRange(ymin, ymax)
+
+    def schedule_plot_update(self, index: int, values: list, pen: str) -> None:
+        """
+        Schedule a set_velocity_curve call for the next screen refresh.
+
+        Several updates arriving within one refresh interval are coalesced so the
+        plot is redrawn once with the latest values.
+
+        Args:
+            index: Index of the ROI whose velocities are plotted.
+            values: The ROI's velocity history.
+            pen: Pen used when the curve is created.
+        """
+        self._pending_curves[index] = (values, pen)
+        if not self._graph_timer.isActive():
+            self._graph_timer.start()
+
+    @Slot()
+    def _flush_graph(self) -> None:
+        """Apply the curve updates scheduled since the last refresh."""
+        pending, self._pending_curves = self._pending_curves, {}
+        for index, (values, pen) in pending.items():
+            self.set_velocity_curve(index, values, pen)
+
+    def remove_velocity_curves(self, keep: int = 0) -> None:
+        """
+        Remove the velocity curves from index keep onwards.
+
+        Args:
+            keep: Number of leading curves to keep, 0 removes all of them.
+        """
+        for index in [i for i in self._pending_curves if i >= keep]:
+            del self._pending_curves[index]
+        for index in [i for i in self.velocity_curves if i >= keep]:
+            self.plot_widget.removeItem(self.velocity_curves.pop(index))
+            del self._velocity_y_bufs[index]
+
     def _create_media_controls(self, layout: QVBoxLayout) -> None:
         """
         Create media control buttons (play/pause) below the video canvas.
@@ -612,20 +938,9 @@ class MainGUIWindow(QMainWindow):
         
         # Create play/pause button
         self.play_pause_button = QPushButton()
-        self.play_pause_button.setIcon(QIcon(self.resource_path("froth_monitor/resources/pause_icon.ico")))
+        self.play_pause_button.setIcon(IconCache.pause())
 
-        self.play_pause_button.setIconSize(QSize(24, 24))
-        self.play_pause_button.setStyleSheet(
-            """
-            QPushButton {
-                background-color: #4285f4; color: white; font-size: 14px; padding: 8px; \
-            border-radius: 4px;
-            }
-            QPushButton:hover {
-                background-color: #3367d6;
-            }
-            """
-        )
+        self.play_pause_button.setIconSize(_ICON_SIZE_24)
         self.play_pause_button.setFixedSize(40, 40)
         self.play_pause_button.setToolTip("Play/Pause Video")
         
@@ -641,6 +956,7 @@ class MainGUIWindow(QMainWindow):
 
 
 if __name__ == "__main__":
+    disable_vsync()
     app = QApplication(sys.argv)
     app.setStyleSheet("""
         QLabel, QLineEdit, QRadioButton, QPushButton, QGroupBox, QMenuBar, QMenu, QMessageBox {
@@ -27,7 +27,9 @@ the velocity history.
 """
 
 import cv2
+import os
 import numpy as np
+from concurrent.futures import ThreadPoolExecutor
 from cv2.typing import MatLike
 from typing import cast
 
@@ -55,6 +57,8 @@ class VideoAnalysis:
         The x component of the scrolling axis direction.
     arrow_dir_y : float
         The y component of the scrolling axis direction.
+    farneback_params : dict
+        The parameters passed to cv2.calcOpticalFlowFarneback.
 
     Methods:
     -------
@@ -62,6 +66,11 @@ class VideoAnalysis:
         Initializes the VideoAnalysisModule with the given scrolling axis direction.
     analyze(current_frame: np.ndarray) -> tuple[float, float]
         Processes the current frame to calculate motion velocities using dense optical flow.
+    analyze_pair(previous_gray, current_frame) -> tuple[tuple[float, float], MatLike]
+        Calculates the motion between a previous grayscale frame and the current frame
+        without modifying the instance.
+    analyze_batch(previous_frames, frames) -> list
+        Runs analyze_pair for several regions in parallel.
     get_current_velocity(avg_flow_x: float, avg_flow_y: float) -> float
         Calculates the velocity in the scrolling axis direction.
     get_current_time() -> str
@@ -74,6 +83,10 @@ class VideoAnalysis:
         Generates a random RGB color.
     """
 
+    # Thread pool shared by all instances to analyze several regions at once.
+    # OpenCV releases the GIL, so the optical flow of each region runs in parallel.
+    _executor: ThreadPoolExecutor | None = None
+
     def __init__(self, arrow_dir_x: float, arrow_dir_y: float) -> None:
         """
         Initialize the VideoAnalysisModule with the given direction for the scrolling axis.
@@ -91,14 +104,27 @@ class VideoAnalysis:
         self.arrow_dir_x = arrow_dir_x
         self.arrow_dir_y = arrow_dir_y
 
-    def analyze(self, current_frame: np.ndarray) -> tuple[float, float]:
+        # Parameters of the Farneback dense optical flow, shared by every region
+        # analyzed with this instance
+        self.farneback_params = dict(
+            pyr_scale=0.5,
+            levels=3,
+            winsize=25,
+            iterations=3,
+            poly_n=7,
+            poly_sigma=1.5,
+            flags=0,
+        )
+
+    def analyze(self, current_frame: np.ndarray | cv2.UMat) -> tuple[float, float]:
         """
         Analyze the given frame for changes in x and y directions by calculating dense optical flow using the Farneback method.
 
         Parameters
         ----------
-        current_frame : np.ndarray
-            The frame to analyze.
+        current_frame : np.ndarray | cv2.UMat
+            The frame to analyze. A cv2.UMat keeps the computation on the OpenCL
+            device; only the two averaged values are read back.
 
         Returns
         -------
@@ -106,39 +132,94 @@ class VideoAnalysis:
             The delta pixel values in x and y directions between the current and previous frames.
         """
 
-        # Analyze the given frame for changes in x and y directions
-        if self.previous_frame is None:
-            # If there's no previous frame, store the current frame and return
-            self.previous_frame = current_frame
-            return cast(float, None), cast(float, None)
+        delta_pixels, self.previous_frame = self.analyze_pair(
+            self.previous_frame, current_frame
+        )
+        return delta_pixels
+
+    def analyze_pair(
+        self,
+        previous_gray: MatLike | cv2.UMat | None,
+        current_frame: np.ndarray | cv2.UMat,
+    ) -> tuple[tuple[float, float], MatLike | cv2.UMat]:
+        """
+        Calculate the movement between a previous grayscale frame and the current frame.
+
+        This method does not modify the instance, so a single VideoAnalysis can be
+        shared by all regions, each of which keeps its own previous frame.
+
+        Parameters
+        ----------
+        previous_gray : MatLike | cv2.UMat | None
+            The grayscale previous frame returned by the last call for this region,
+            or None if this is the first frame.
+        current_frame : np.ndarray | cv2.UMat
+            The BGR frame to analyze.
+
+        Returns
+        -------
+        tuple[tuple[float, float], MatLike | cv2.UMat]
+            The delta pixel values in x and y directions (None, None for the first
+            frame) and the grayscale current frame to pass in on the next call.
+        """
+
+        # Only the current frame needs converting; the previous one is kept in grayscale
+        gray_current = cv2.cvtColor(current_frame, cv2.COLOR_BGR2GRAY)
 
-        # Convert both current and previous frames to grayscale
-        gray_current: MatLike = cv2.cvtColor(current_frame, cv2.COLOR_BGR2GRAY)
-        gray_previous: MatLike = cv2.cvtColor(self.previous_frame, cv2.COLOR_BGR2GRAY)
+        if previous_gray is None:
+            # If there's no previous frame, only return the current one for next time
+            return (cast(float, None), cast(float, None)), gray_current
 
         # Calculate dense optical flow using Farneback method
         flow = cv2.calcOpticalFlowFarneback(
-            prev=gray_previous,
+            prev=previous_gray,
             next=gray_current,
             flow=cast(MatLike, None),
-            pyr_scale=0.5,
-            levels=3,
-            winsize=25,
-            iterations=3,
-            poly_n=7,
-            poly_sigma=1.5,
-            flags=0,
+            **self.farneback_params,
         )
 
-        # Extract flow components in x and y directions
-        flow_x = flow[..., 0]
-        flow_y = flow[..., 1]
+        # Average the flow components in x and y directions
+        avg_flow_x, avg_flow_y = cv2.mean(flow)[:2]
 
-        avg_flow_x = cast(float, np.mean(flow_x))
-        avg_flow_y = cast(float, np.mean(flow_y))
+        # Return delta pixel values for the current frame
+        return (avg_flow_x, avg_flow_y), gray_current
 
-        # Update the previous frame to the current frame for the next analysis
-        self.previous_frame = current_frame
+    def analyze_batch(
+        self,
+        previous_frames: list[MatLike | cv2.UMat | None],
+        frames: list[np.ndarray] | list[cv2.UMat],
+    ) -> list[tuple[tuple[float, float], MatLike | cv2.UMat]]:
+        """
+        Analyze a batch of regions with analyze_pair.
 
-        # Return delta pixel values for the current frame
-        return avg_flow_x, avg_flow_y
+        When there is more than one frame, they are analyzed in parallel on a
+        shared thread pool. analyze_pair has no side effects, so the results are
+        the same as analyzing the frames one after another.
+
+        Parameters
+        ----------
+        previous_frames : list[MatLike | cv2.UMat | None]
+            The grayscale previous frame of each region.
+        frames : list[np.ndarray] | list[cv2.UMat]
+            The current frames to analyze, in the same order as `previous_frames`.
+
+        Returns
+        -------
+        list[tuple[tuple[float, float], MatLike | cv2.UMat]]
+            The delta pixels and the new grayscale previous frame of each region.
+        """
+
+        if len(frames) < 2:
+            return [
+                self.analyze_pair(previous, frame)
+                for previous, frame in zip(previous_frames, frames)
+            ]
+
+        if VideoAnalysis._executor is None:
+            VideoAnalysis._executor = ThreadPoolExecutor(
+                max_workers=os.cpu_count(), thread_name_prefix="VideoAnalysis"
+            )
+
+        return list(
+            VideoAnalysis._executor.map(self.analyze_pair, previous_frames, frames)
+        )
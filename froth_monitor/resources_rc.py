@@ -0,0 +1,96 @@
+# Resource object code (Python 3)
+# Created by: object code
+# Created by: The Resource Compiler for Qt version 6.12.0
+# WARNING! All changes made in this file will be lost!
+
+from PySide6 import QtCore
+
+qt_resource_data = b"\
+\x00\x00\x01^\
+<\
+?xml version=\x221.\
+0\x22 encoding=\x22UTF\
+-8\x22?>\x0a<svg xmlns\
+=\x22http://www.w3.\
+org/2000/svg\x22 wi\
+dth=\x2224\x22 height=\
+\x2224\x22 viewBox=\x220 \
+0 24 24\x22 fill=\x22n\
+one\x22 stroke=\x22whi\
+te\x22 stroke-width\
+=\x222\x22 stroke-line\
+cap=\x22round\x22 stro\
+ke-linejoin=\x22rou\
+nd\x22>\x0a  <path d=\x22\
+M23 19a2 2 0 0 1\
+-2 2H3a2 2 0 0 1\
+-2-2V8a2 2 0 0 1\
+ 2-2h4l2-3h6l2 3\
+h4a2 2 0 0 1 2 2\
+z\x22/>\x0a  <circle c\
+x=\x2212\x22 cy=\x2213\x22 r\
+=\x224\x22/>\x0a</svg>\
+\x00\x00\x00\x95\
+<\
+svg xmlns=\x22http:\
+//www.w3.org/200\
+0/svg\x22 width=\x2224\
+\x22 height=\x2224\x22 vi\
+ewBox=\x220 0 24 24\
+\x22 fill=\x22white\x22>\x0a\
+  <path d=\x22M6 19\
+h4V5H6v14zm8-14v\
+14h4V5h-4z\x22/>\x0a</\
+svg>\
+\x00\x00\x00\x83\
+<\
+svg xmlns=\x22http:\
+//www.w3.org/200\
+0/svg\x22 width=\x2224\
+\x22 height=\x2224\x22 vi\
+ewBox=\x220 0 24 24\
+\x22 fill=\x22white\x22>\x0a\
+  <path d=\x22M8 5v\
+14l11-7z\x22/>\x0a</sv\
+g>\
+"
+
+qt_resource_name = b"\
+\x00\x05\
+\x00o\xa6S\
+\x00i\
+\x00c\x00o\x00n\x00s\
+\x00\x0f\
+\x01\xf0\x14\xc7\
+\x00c\
+\x00a\x00m\x00e\x00r\x00a\x00_\x00i\x00c\x00o\x00n\x00.\x00s\x00v\x00g\
+\x00\x0e\
+\x0b\xf2,\x87\
+\x00p\
+\x00a\x00u\x00s\x00e\x00_\x00i\x00c\x00o\x00n\x00.\x00s\x00v\x00g\
+\x00\x0d\
+\x080\xb0\xe7\
+\x00p\
+\x00l\x00a\x00y\x00_\x00i\x00c\x00o\x00n\x00.\x00s\x00v\x00g\
+"
+
+qt_resource_struct = b"\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x01\
+\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x03\x00\x00\x00\x02\
+\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x10\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
+\x00\x00\x01\x97c\xedi\xe8\
+\x00\x00\x00V\x00\x00\x00\x00\x00\x01\x00\x00\x01\xfb\
+\x00\x00\x01\x97c\xedi\xe8\
+\x00\x00\x004\x00\x00\x00\x00\x00\x01\x00\x00\x01b\
+\x00\x00\x01\x97c\xedi\xe8\
+"
+
+def qInitResources():
+    QtCore.qRegisterResourceData(0x03, qt_resource_struct, qt_resource_name, qt_resource_data)
+
+def qCleanupResources():
+    QtCore.qUnregisterResourceData(0x03, qt_resource_struct, qt_resource_name, qt_resource_data)
+
+qInitResources()
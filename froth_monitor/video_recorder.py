@@ -3,17 +3,182 @@
 This module defines the `VideoRecorder` class, which provides functionality for
 recording video frames from the camera thread to a video file. It handles
 initialization of the video writer, frame processing, and file management.
+
+Frames are encoded to H.264 by an ffmpeg subprocess when ffmpeg is installed,
+preferring a hardware encoder, and with OpenCV's VideoWriter otherwise (H.264
+if OpenCV's build can encode it, XVID if not). Frames
+are written by a background thread so encoding never blocks the caller.
 """
 
 import cv2
 import os
 import time
+import queue
+import shutil
+import tempfile
+import threading
+import functools
+import subprocess
 import numpy as np
 from datetime import datetime
-from typing import Optional, Tuple, cast
+from typing import Callable, Optional, Tuple, cast
 from PySide6.QtCore import QObject, Signal
 from PySide6.QtWidgets import QMessageBox
 
+# H.264 encoders tried, in order, when ffmpeg is available; hardware encoders
+# first, each with default options favouring encoding speed and low latency
+_FFMPEG_H264_ENCODERS = {
+    "h264_nvenc": {"-preset": "p1", "-tune": "ll", "-delay": "0"},
+    "h264_amf": {"-usage": "lowlatency"},
+    "h264_qsv": {"-preset": "veryfast"},
+    "libx264": {"-preset": "ultrafast", "-tune": "zerolatency"},
+}
+
+
+# start_recording preset and tune values each encoder accepts, and translations
+# of the other encoders' values; anything else is left out of the command
+_X264_PRESETS = ("ultrafast", "superfast", "veryfast", "faster", "fast",
+                 "medium", "slow", "slower", "veryslow")
+_NVENC_TO_X264_PRESET = {"p1": "ultrafast", "p2": "ultrafast", "p3": "ultrafast",
+                         "p4": "fast", "p5": "fast", "p6": "fast", "p7": "fast"}
+_ENCODER_VALUES = {
+    "h264_nvenc": {
+        "-preset": {**{p: p for p in _NVENC_TO_X264_PRESET},
+                    "ultrafast": "p1", "superfast": "p1", "veryfast": "p2", "faster": "p3",
+                    "fast": "p4", "medium": "p4", "slow": "p5", "slower": "p6", "veryslow": "p7"},
+        "-tune": {"hq": "hq", "ll": "ll", "ull": "ull", "zerolatency": "ll"},
+    },
+    "h264_amf": {},
+    "h264_qsv": {
+        # QSV has the x264 presets from veryfast down
+        "-preset": {**{p: p for p in _X264_PRESETS[2:]},
+                    "ultrafast": "veryfast", "superfast": "veryfast",
+                    **{p: "veryfast" if v == "ultrafast" else v
+                       for p, v in _NVENC_TO_X264_PRESET.items()}},
+    },
+    "libx264": {
+        "-preset": {**{p: p for p in _X264_PRESETS}, **_NVENC_TO_X264_PRESET},
+        "-tune": {"zerolatency": "zerolatency", "ll": "zerolatency", "ull": "zerolatency",
+                  "film": "film", "animation": "animation", "grain": "grain",
+                  "stillimage": "stillimage", "fastdecode": "fastdecode"},
+    },
+}
+
+
+def _translate_encoder_value(encoder: str, option: str, value: str) -> Optional[str]:
+    """
+    Translate a start_recording preset or tune value to one the encoder accepts.
+
+    Args:
+        encoder (str): The ffmpeg H.264 encoder.
+        option (str): "-preset" or "-tune".
+        value (str): The value given to start_recording.
+
+    Returns:
+        Optional[str]: The encoder's value, or None if it has no equivalent.
+    """
+    return _ENCODER_VALUES[encoder].get(option, {}).get(value)
+
+
+# ffmpeg encoder used for each explicit start_recording codec
+_CODEC_FFMPEG_ENCODERS = {"nvenc": "h264_nvenc", "x264": "libx264"}
+CODECS = ("auto", "nvenc", "x264", "xvid", "mjpeg")
+
+# Seconds to wait for ffmpeg to reject its command line before recording
+_FFMPEG_STARTUP_CHECK = 0.1
+
+# FourCC codes of the OpenCV writers
+_AVC1_FOURCC = cv2.VideoWriter.fourcc(*'avc1')
+_XVID_FOURCC = cv2.VideoWriter.fourcc(*'XVID')
+_MJPG_FOURCC = cv2.VideoWriter.fourcc(*'MJPG')
+
+
+@functools.lru_cache(maxsize=None)
+def _ffmpeg_encoder_list() -> str:
+    """Return the output of ``ffmpeg -encoders``, or "" if ffmpeg cannot be run."""
+    ffmpeg = shutil.which("ffmpeg")
+    if ffmpeg is None:
+        return ""
+    try:
+        return subprocess.run(
+            [ffmpeg, "-hide_banner", "-encoders"], capture_output=True, text=True, timeout=10
+        ).stdout
+    except (OSError, subprocess.SubprocessError):
+        return ""
+
+
+@functools.lru_cache(maxsize=None)
+def ffmpeg_encoder_works(encoder: str) -> bool:
+    """
+    Check once per process whether the installed ffmpeg can use an encoder.
+
+    ffmpeg lists hardware encoders even on machines without the matching GPU,
+    so a listed encoder must also encode a test frame.
+
+    Args:
+        encoder (str): The ffmpeg encoder name.
+
+    Returns:
+        bool: True if the encoder works.
+    """
+    if f" {encoder} " not in _ffmpeg_encoder_list():
+        return False
+    test = [
+        "ffmpeg", "-hide_banner", "-loglevel", "error",
+        "-f", "lavfi", "-i", "color=size=256x256:rate=1", "-frames:v", "1",
+        "-c:v", encoder, "-f", "null", "-",
+    ]
+    try:
+        return subprocess.run(test, capture_output=True, timeout=10).returncode == 0
+    except (OSError, subprocess.SubprocessError):
+        return False
+
+
+@functools.lru_cache(maxsize=None)
+def ffmpeg_h264_encoder() -> Optional[str]:
+    """
+    Find the fastest H.264 encoder the installed ffmpeg can use.
+
+    Returns:
+        Optional[str]: The encoder name, or None if ffmpeg is not installed or
+        none of the encoders works.
+    """
+    return next((e for e in _FFMPEG_H264_ENCODERS if ffmpeg_encoder_works(e)), None)
+
+
+def _open_opencv_h264(path: str, fps: float, size: Tuple[int, int]) -> cv2.VideoWriter:
+    """Open an OpenCV H.264 writer, hardware accelerated where the backend supports it."""
+    return cv2.VideoWriter(
+        path, cv2.CAP_FFMPEG, _AVC1_FOURCC, fps, size,
+        [cv2.VIDEOWRITER_PROP_HW_ACCELERATION, cv2.VIDEO_ACCELERATION_ANY],
+    )
+
+
+def _check_frame_shape(frame, expected_shape: Tuple[int, int, int]) -> None:
+    """
+    Check that a frame matches the recording's dimensions.
+
+    Raises:
+        ValueError: If the frame has a different shape.
+    """
+    if frame.shape != expected_shape:
+        raise ValueError(f"Frame shape {frame.shape} does not match the recording's {expected_shape}")
+
+
+@functools.lru_cache(maxsize=None)
+def opencv_h264_available() -> bool:
+    """
+    Check once per process whether OpenCV's VideoWriter can encode H.264.
+
+    Returns:
+        bool: True if a test H.264 writer could be opened.
+    """
+    with tempfile.TemporaryDirectory() as tmp:
+        writer = _open_opencv_h264(os.path.join(tmp, "probe.mp4"), 30.0, (64, 64))
+        available = writer.isOpened()
+        writer.release()
+    return available
+
 
 class VideoRecorder(QObject):
     """
@@ -21,16 +186,37 @@ class VideoRecorder(QObject):
 
     This class handles the recording of video frames from the camera thread
     to a video file. It manages the video writer initialization, frame processing,
-    and file management.
+    and file management. record_frame only queues the frame; a writer thread
+    passes queued frames to the encoder. When recording a video file, record_frame
+    waits for room in the queue so no frame is lost; for live captures, frames
+    arriving while the queue is full are dropped according to drop_policy.
+
+    Live camera captures feeding the recorder should be passed to
+    configure_capture_for_recording before frames are read from them, so the
+    recorded frames are not several frames behind the camera.
+
+    Interval recordings can call flush_segment to finish the current file and
+    continue in a new one without stopping the recording.
 
     Attributes:
         recording_started (Signal): Signal emitted when recording starts.
         recording_stopped (Signal): Signal emitted when recording stops.
+        recording_failed (Signal): Signal emitted with the reason when the recorder
+            stops a recording itself, after recording_stopped.
         is_recording (bool): Flag indicating if recording is currently active.
-        video_writer: OpenCV VideoWriter object for video output.
+            Per-frame callers can read it directly instead of calling is_active().
+        ffmpeg_process: ffmpeg subprocess encoding the frames written to its stdin,
+            or None when the OpenCV writer is used.
+        video_writer: OpenCV VideoWriter object for video output when ffmpeg is
+            not available.
         output_path (str): Path where the video file will be saved.
+        segment_index (int): Number of segments finished by flush_segment.
         frame_count (int): Counter for the number of frames recorded.
-        start_time (float): Timestamp when recording started.
+        dropped_frames (int): Number of live frames dropped because the queue was full.
+        drop_policy (str): "newest" drops the incoming live frame when the queue is
+            full, "oldest" drops the oldest queued frame to make room for it.
+        start_time (float): time.monotonic() value when recording started.
+        duration (float): Wall-clock length of the last finished recording in seconds.
         frame_width (int): Width of the video frame.
         frame_height (int): Height of the video frame.
         fps (float): Frames per second for the output video.
@@ -39,166 +225,548 @@ class VideoRecorder(QObject):
     # Signals for recording state changes
     recording_started = Signal(str)  # Emits the output path when recording starts
     recording_stopped = Signal(str, int)  # Emits the output path and frame count when recording stops
+    recording_failed = Signal(str)  # Emits the reason when a recording has to be stopped
 
-    def __init__(self):
+    def __init__(self, queue_size: int = 8, drop_policy: str = "newest"):
         """
         Initialize the VideoRecorder with default values.
+
+        Args:
+            queue_size (int, optional): Number of frames that can wait for the
+                encoder. Defaults to 8.
+            drop_policy (str, optional): Which live frame to drop when the queue is
+                full, "newest" or "oldest". Defaults to "newest".
         """
         super().__init__()
+        if drop_policy not in ("newest", "oldest"):
+            raise ValueError(f"Unknown drop policy: {drop_policy}")
+        self.drop_policy = drop_policy
+        self._queue: queue.Queue = queue.Queue(maxsize=queue_size)
+        self._writer_thread: Optional[threading.Thread] = None
+        self.dropped_frames = 0
         self.is_recording = False
+        self.ffmpeg_process: Optional[subprocess.Popen] = None
         self.video_writer = None
         self.output_path = ""
+        self._codec = "auto"
+        self._segment_base = ""
+        self.segment_index = 0
         self.frame_count = 0
         self.start_time = 0.0
+        self.duration = 0.0
         self.frame_width = 0
         self.frame_height = 0
+        self._encoder_options: dict = {}
+        self._expected_shape = (0, 0, 3)
+        self._yuv_frame: Optional[np.ndarray] = None  # I420 frame piped to ffmpeg
         self.fps = 30.0  # Default FPS
         self.frame_interval = 0.0  # Time interval between frames
         self.is_video_file = False  # Flag to indicate if recording from a video file or camera
         self.previous_frame = cast(np.ndarray, None)  # Store the previous frame for comparison
 
+    @staticmethod
+    def configure_capture_for_recording(cap: cv2.VideoCapture) -> bool:
+        """
+        Limit a live capture's frame buffer to one frame.
+
+        Backends such as V4L2 buffer several frames by default, so each read
+        returns an old frame. Call this before the first read.
+
+        Args:
+            cap (cv2.VideoCapture): The opened camera capture.
+
+        Returns:
+            bool: True if the backend accepted the buffer size.
+        """
+        accepted = cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+        if not accepted:
+            print("Capture backend does not support setting the buffer size")
+        return accepted
+
     def start_recording(self, directory: str, filename: str, 
     frame_width: int, frame_height: int, fps: float = 30.0,
-    is_video_file: bool = False) -> bool:
+    is_video_file: bool = False, codec: str = "auto",
+    preset: Optional[str] = None, bitrate: Optional[str] = None,
+    gop: Optional[int] = None, tune: Optional[str] = None) -> bool:
         """
         Start recording video frames to a file.
 
+        preset, bitrate, gop and tune only apply when ffmpeg encodes the video.
+        Presets and tunings are translated to the chosen encoder's nearest value
+        (e.g. "p4" becomes "fast" for libx264) and skipped if it has none.
+
         Args:
             directory (str): Directory where the video file will be saved.
             filename (str): Base filename for the video file (without extension).
             frame_width (int): Width of the video frame.
             frame_height (int): Height of the video frame.
             fps (float, optional): Frames per second for the output video. Defaults to 30.0.
+            codec (str, optional): "auto" uses the fastest available H.264 encoder
+                and falls back to XVID, then MJPEG, "nvenc" requires ffmpeg's NVENC
+                encoder, "x264" uses ffmpeg's libx264 or OpenCV's H.264 encoder,
+                "xvid" uses OpenCV's XVID encoder and "mjpeg" uses OpenCV's
+                built-in MJPEG encoder, which writes an .avi file. Defaults to "auto".
+            preset (str, optional): ffmpeg encoder preset, e.g. "p1" to "p7" for
+                NVENC or "ultrafast" to "veryslow" for libx264. Defaults to the
+                encoder's low-latency preset.
+            bitrate (str, optional): Constant bitrate such as "8M". Defaults to
+                the encoder's rate control.
+            gop (int, optional): Keyframe interval in frames. Defaults to the
+                encoder's.
+            tune (str, optional): ffmpeg encoder tuning, e.g. "ll" for NVENC or
+                "zerolatency" for libx264. Defaults to the encoder's low-latency
+                tuning.
 
         Returns:
             bool: True if recording started successfully, False otherwise.
         """
         if self.is_recording:
             return False
+        if codec not in CODECS:
+            raise ValueError(f"Unknown codec: {codec}")
 
         # Store frame dimensions and fps
         self.frame_width = frame_width
         self.frame_height = frame_height
+        self._expected_shape = (frame_height, frame_width, 3)
         self.fps = fps
         self.frame_interval = 1.0 / fps
         self.is_video_file = is_video_file
+        self._encoder_options = {"-preset": preset, "-tune": tune, "-b:v": bitrate,
+                                 "-g": None if gop is None else str(gop)}
 
         # Create output directory if it doesn't exist
-        if not os.path.exists(directory):
-            try:
-                os.makedirs(directory)
-            except OSError as e:
-                print(f"Error creating directory: {e}")
-                return False
+        try:
+            os.makedirs(directory, exist_ok=True)
+        except OSError as e:
+            print(f"Error creating directory: {e}")
+            return False
 
         # Generate output path with timestamp to avoid overwriting
         # timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         self.output_path = os.path.join(directory, f"{filename}.mp4")
+        self._segment_base = os.path.join(directory, filename)
+        self._codec = codec
 
-        # Initialize video writer
-        # Use H.264 codec (XVID is more widely supported than mp4v)
-        fourcc = cv2.VideoWriter.fourcc(*'XVID')
-        self.video_writer = cv2.VideoWriter(self.output_path, fourcc, fps, (frame_width, frame_height))
-
-        if not self.video_writer.isOpened():
+        if not self._open_encoder(codec):
             print("Failed to open video writer")
             return False
 
         # Reset counters
         self.frame_count = 0
-        self.start_time = time.time()
+        self.dropped_frames = 0
+        self.segment_index = 0
+        self.start_time = time.monotonic()
         self.is_recording = True
+        self.record_frame = self._make_fast_writer()
+        self._start_writer()
 
         # Emit signal that recording has started
         self.recording_started.emit(self.output_path)
         return True
 
+    def _open_encoder(self, codec: str) -> bool:
+        """
+        Open the encoder for the requested codec, preferring ffmpeg over OpenCV.
+
+        Args:
+            codec (str): One of CODECS.
+
+        Returns:
+            bool: True if an encoder was opened.
+        """
+        if codec == "auto":
+            encoders = [e for e in _FFMPEG_H264_ENCODERS if ffmpeg_encoder_works(e)]
+        else:
+            encoder = _CODEC_FFMPEG_ENCODERS.get(codec)
+            encoders = [encoder] if encoder is not None and ffmpeg_encoder_works(encoder) else []
+        for encoder in encoders:
+            self.ffmpeg_process = self._open_ffmpeg(encoder)
+            if self.ffmpeg_process is not None:
+                return True
+
+        size = (self.frame_width, self.frame_height)
+        if codec in ("auto", "x264") and opencv_h264_available():
+            self.video_writer = _open_opencv_h264(self.output_path, self.fps, size)
+            return self.video_writer.isOpened()
+        if codec in ("auto", "xvid"):
+            # XVID is more widely supported than mp4v
+            self.video_writer = cv2.VideoWriter(self.output_path, _XVID_FOURCC, self.fps, size)
+            if self.video_writer.isOpened():
+                return True
+        if codec in ("auto", "mjpeg"):
+            return self._open_mjpeg()
+        return False
+
+    def _open_mjpeg(self) -> bool:
+        """
+        Open OpenCV's built-in MJPEG writer and change the output path to .avi.
+
+        The writer needs no codec library, and JPEG frames are independent, so
+        OpenCV encodes strips of each frame in parallel on all CPU cores.
+
+        Returns:
+            bool: True if the writer was opened.
+        """
+        self.output_path = os.path.splitext(self.output_path)[0] + ".avi"
+        self.video_writer = cv2.VideoWriter(self.output_path, cv2.CAP_OPENCV_MJPEG, _MJPG_FOURCC,
+                                            self.fps, (self.frame_width, self.frame_height))
+        self.video_writer.set(cv2.VIDEOWRITER_PROP_QUALITY, 90)
+        return self.video_writer.isOpened()
+
+    def _open_ffmpeg(self, encoder: str) -> Optional[subprocess.Popen]:
+        """
+        Start an ffmpeg process that encodes raw frames from its stdin.
+
+        Frames with even dimensions are converted to I420 (yuv420p) before they
+        are piped, which halves the bytes written and saves ffmpeg's own colour
+        conversion; other frames are piped as BGR and padded to even dimensions,
+        which yuv420p output requires.
+
+        Args:
+            encoder (str): The ffmpeg H.264 encoder to use.
+
+        Returns:
+            Optional[subprocess.Popen]: The ffmpeg process, or None if it could not
+            be started or exited straight away, e.g. rejecting an option.
+        """
+        # Options given to start_recording override the encoder's defaults;
+        # presets and tunings are translated to the encoder's own values
+        options = dict(_FFMPEG_H264_ENCODERS[encoder])
+        for option, value in self._encoder_options.items():
+            if value is None:
+                continue
+            if option in ("-preset", "-tune"):
+                translated = _translate_encoder_value(encoder, option, value)
+                if translated is None:
+                    print(f"{encoder} has no {option[1:]} {value!r}, using its default")
+                    continue
+                value = translated
+            options[option] = value
+        if self._encoder_options.get("-b:v") and encoder == "h264_nvenc":
+            options["-rc"] = "cbr"
+
+        if self.frame_width % 2 == 0 and self.frame_height % 2 == 0:
+            self._yuv_frame = np.empty((self.frame_height * 3 // 2, self.frame_width), np.uint8)
+            pix_fmt = "yuv420p"
+            filters = []
+        else:
+            self._yuv_frame = None
+            pix_fmt = "bgr24"
+            filters = ["-vf", "pad=ceil(iw/2)*2:ceil(ih/2)*2"]
+
+        command = [
+            "ffmpeg", "-y", "-hide_banner", "-loglevel", "error",
+            "-f", "rawvideo", "-pix_fmt", pix_fmt,
+            "-s", f"{self.frame_width}x{self.frame_height}", "-r", str(self.fps),
+            "-i", "-",
+            *filters,
+            "-c:v", encoder, *(arg for option in options.items() for arg in option),
+            "-pix_fmt", "yuv420p",
+            self.output_path,
+        ]
+        try:
+            process = subprocess.Popen(command, stdin=subprocess.PIPE, bufsize=0)
+        except OSError as e:
+            print(f"Error starting ffmpeg: {e}")
+            return None
+
+        # ffmpeg rejects unknown options before reading any input
+        try:
+            process.wait(timeout=_FFMPEG_STARTUP_CHECK)
+        except subprocess.TimeoutExpired:
+            return process
+        print(f"ffmpeg exited with code {process.returncode} using {encoder}")
+        process.stdin.close()
+        return None
+
+    def _write_frame(self, frame, repeat: int = 1) -> None:
+        """
+        Pass a frame to the encoder.
+
+        Args:
+            frame: The frame to write (OpenCV image format).
+            repeat (int, optional): Number of times to write the frame. Defaults to 1.
+        """
+        if self.ffmpeg_process is not None:
+            if self._yuv_frame is not None:
+                frame = cv2.cvtColor(frame, cv2.COLOR_BGR2YUV_I420, dst=self._yuv_frame)
+            # Write the array's own buffer rather than a tobytes() copy
+            data = np.ascontiguousarray(frame).data.cast("B")
+            for _ in range(repeat):
+                # The unbuffered pipe may accept only part of the frame
+                written = 0
+                while written < len(data):
+                    written += self.ffmpeg_process.stdin.write(data[written:])
+        else:
+            for _ in range(repeat):
+                self.video_writer.write(frame)
+
+    def _start_writer(self) -> None:
+        """
+        Start the thread that passes queued frames to the encoder.
+        """
+        self._writer_thread = threading.Thread(target=self._writer_loop, daemon=True)
+        self._writer_thread.start()
+
+    def _close_encoder(self) -> None:
+        """
+        Write the queued frames, stop the writer thread and close the encoder.
+        """
+        # Let the writer thread write the queued frames and exit; a thread that
+        # has already died would never take the sentinel from a full queue
+        if self._writer_thread.is_alive():
+            self._queue.put(None)
+            self._writer_thread.join()
+        self._writer_thread = None
+        while not self._queue.empty():
+            self._queue.get_nowait()
+
+        # Let ffmpeg finish the file, or release the video writer
+        if self.ffmpeg_process is not None:
+            self.ffmpeg_process.stdin.close()
+            self.ffmpeg_process.wait()
+            self.ffmpeg_process = None
+        else:
+            self.video_writer.release()
+            self.video_writer = None
+
+    def _writer_loop(self) -> None:
+        """
+        Write queued (frame, repeat) pairs until the None sentinel is received.
+
+        Runs in the writer thread.
+        """
+        while (item := self._queue.get()) is not None:
+            try:
+                self._write_frame(*item)
+            except Exception as e:
+                # e.g. the ffmpeg process exited or a frame could not be converted;
+                # keep draining the queue so stopping the recording cannot block
+                print(f"Error writing frame: {e}")
+
+    def _enqueue(self, frame, repeat: int = 1) -> None:
+        """
+        Queue a frame for the writer thread.
+
+        Frames of a video file wait for room in the queue; live frames never
+        block and are dropped according to drop_policy when the queue is full.
+
+        Args:
+            frame: The frame to write (OpenCV image format).
+            repeat (int, optional): Number of times the writer writes the frame,
+                taking a single queue slot. Defaults to 1.
+        """
+        if self.is_video_file:
+            # The file is not paced by a camera, so wait for the encoder rather than lose frames
+            self._queue.put((frame, repeat))
+            self.frame_count += repeat
+            return
+
+        try:
+            self._queue.put_nowait((frame, repeat))
+            self.frame_count += repeat
+        except queue.Full:
+            if not self.dropped_frames:
+                print("Warning: the encoder cannot keep up, dropping live frames")
+            if self.drop_policy == "newest":
+                self.dropped_frames += repeat
+                return
+            # Replace the oldest queued frame with this one; only the writer
+            # thread also takes frames, so there is room afterwards
+            try:
+                _, dropped = self._queue.get_nowait()
+            except queue.Empty:
+                dropped = 0
+            self._queue.put_nowait((frame, repeat))
+            self.dropped_frames += dropped
+            self.frame_count += repeat - dropped
+
+    def _make_fast_writer(self) -> Callable[[np.ndarray], bool]:
+        """
+        Build the record_frame used while recording.
+
+        The frame interval, the source type and the bound methods are fixed by
+        start_recording, so they are captured in locals instead of being looked
+        up on every frame. The returned function only checks the first frame's
+        dimensions, then installs the writer for the remaining frames.
+
+        Returns:
+            Callable[[np.ndarray], bool]: A record_frame replacement for this recording.
+        """
+        enqueue = self._enqueue
+        expected_shape = self._expected_shape
+
+        if self.is_video_file:
+            def record_file_frame(frame) -> bool:
+                enqueue(frame)
+                return True
+
+            writer = record_file_frame
+        else:
+            frame_interval = self.frame_interval
+            monotonic = time.monotonic
+
+            def record_live_frame(frame) -> bool:
+                # Repeat the previous frame to keep the same pace of the live video feed
+                # As the fps of a realtime camera might not be constant
+                current_time = monotonic()
+                if self.frame_count > 0:
+                    elapsed = current_time - self.previous_frame_time
+                    if elapsed > frame_interval:
+                        enqueue(self.previous_frame, int(elapsed / frame_interval))
+
+                self.previous_frame = frame
+                self.previous_frame_time = current_time
+
+                # Queue the frame for the writer thread
+                enqueue(frame)
+                return True
+
+            writer = record_live_frame
+
+        def record_first_frame(frame) -> bool:
+            # The dimensions are fixed for the whole recording, so check them once
+            try:
+                _check_frame_shape(frame, expected_shape)
+            except ValueError as e:
+                self._fail_recording(str(e))
+                return False
+            self.record_frame = writer
+            return writer(frame)
+
+        return record_first_frame
+
+    def _fail_recording(self, reason: str) -> None:
+        """
+        Stop the recording because it cannot continue, and report why.
+
+        Args:
+            reason (str): Description of the problem.
+        """
+        print(f"Recording failed: {reason}")
+        self.stop_recording()
+        self.recording_failed.emit(reason)
+
     def record_frame(self, frame) -> bool:
         """
         Record a single frame to the video file.
 
+        start_recording replaces this method on the instance with a writer
+        specialised for the recording, and stop_recording restores it.
+
         Args:
-            frame: The frame to record (OpenCV image format).
+            frame: The frame to record (OpenCV image format). It must have the
+                frame_width and frame_height given to start_recording; frames are
+                not resized.
 
         Returns:
             bool: True if the frame was recorded successfully, False otherwise.
+            If the first frame's dimensions do not match the recording's, the
+            recording is stopped and recording_failed is emitted.
         """
-        if not self.is_recording or self.video_writer is None:
+        if not self.is_recording:
             return False
-        
-        # Insert previous frames to keep the same pace of the live video feed
-        # As the fps of a realtime camera might not be constant
-        if self.frame_count > 0:
-            # Check if it's time to record the next frame
-            if not self.is_video_file:
-                current_time = time.time()
-                print("Live recording")
-                if current_time - self.previous_frame_time > self.frame_interval:
-                    num_interval = int((current_time - self.previous_frame_time) / self.frame_interval)
-                    for _ in range(num_interval):
-                        self.video_writer.write(self.previous_frame)
-                        self.frame_count += 1
-
-        # Ensure frame dimensions match what the writer expects
-        if frame.shape[1] != self.frame_width or frame.shape[0] != self.frame_height:
-            frame = cv2.resize(frame, (self.frame_width, self.frame_height))
-
-        if not self.is_video_file:
-            self.previous_frame = frame
-            self.previous_frame_time = time.time()
-
-        # Write the frame
-        self.video_writer.write(frame)
-        self.frame_count += 1
-        return True
+        return self._make_fast_writer()(frame)
+
+    def _end_recording(self) -> None:
+        """
+        Mark the recording as finished once its encoder is closed.
+        """
+        self.is_recording = False
+        self.__dict__.pop("record_frame", None)  # Back to the generic method
+        self.duration = max(1e-9, time.monotonic() - self.start_time)
+
+    def flush_segment(self) -> Tuple[bool, str]:
+        """
+        Finish the current video file and continue recording into a new one.
+
+        The queued frames are written and the encoder is closed, then an encoder
+        with the same settings is opened on "<filename>_<n>" in the same
+        directory. The frame queue, the codec choice and the frame counters are
+        kept. Closing an ffmpeg encoder only waits for it to finish the file;
+        releasing an OpenCV writer also flushes the one or two frames its
+        encoder holds back, the same cost as stop_recording.
 
-    def stop_recording(self) -> Tuple[bool, str, int]:
+        Returns:
+            Tuple[bool, str]: A tuple containing:
+                - Success flag (False if not recording or the new file could not
+                  be opened, in which case recording stops)
+                - Output path of the finished video
+        """
+        if not self.is_recording:
+            return False, ""
+
+        finished_path = self.output_path
+        self._close_encoder()
+
+        self.segment_index += 1
+        self.output_path = f"{self._segment_base}_{self.segment_index}.mp4"
+        if not self._open_encoder(self._codec):
+            # No writer thread is running now, so frames must not be queued
+            print("Failed to open video writer for the next segment")
+            self._end_recording()
+            self.output_path = finished_path
+            self.recording_stopped.emit(finished_path, self.frame_count)
+            return False, finished_path
+
+        self._start_writer()
+        print(f"Recording segment finished: {finished_path}")
+        return True, finished_path
+
+    def stop_recording(self) -> Tuple[bool, str, int, int]:
         """
         Stop recording and release resources.
 
         Returns:
-            Tuple[bool, str, int]: A tuple containing:
+            Tuple[bool, str, int, int]: A tuple containing:
                 - Success flag (True if stopped successfully)
                 - Output path of the recorded video
                 - Number of frames recorded
+                - Number of live frames dropped because the encoder fell behind
         """
-        if not self.is_recording or self.video_writer is None:
-            return False, "", 0
+        if not self.is_recording:
+            return False, "", 0, 0
 
-        # Release video writer
-        self.video_writer.release()
-        self.video_writer = None
-        self.is_recording = False
+        self._close_encoder()
+        self._end_recording()
 
         # Print recording statistics
         print(f"Recording stopped: {self.output_path}")
         print(f"Frames recorded: {self.frame_count}")
+        print(f"Duration: {self.duration:.1f} s ({self.frame_count / self.duration:.1f} fps)")
+        if self.dropped_frames:
+            print(f"Frames dropped: {self.dropped_frames}")
 
         # Emit signal that recording has stopped
         self.recording_stopped.emit(self.output_path, self.frame_count)
-        return True, self.output_path, self.frame_count
+        return True, self.output_path, self.frame_count, self.dropped_frames
 
     def is_active(self) -> bool:
         """
         Check if recording is currently active.
 
+        Equivalent to reading is_recording, which per-frame code should prefer.
+
         Returns:
             bool: True if recording is active, False otherwise.
         """
         return self.is_recording
 
-    def get_recording_info(self) -> Tuple[str, int, float]:
+    def get_recording_info(self) -> Tuple[str, int, float, int]:
         """
         Get information about the current recording.
 
         Returns:
-            Tuple[str, int, float]: A tuple containing:
+            Tuple[str, int, float, int]: A tuple containing:
                 - Output path of the video
                 - Number of frames recorded
-                - Duration of recording in seconds
+                - Duration of recording in seconds, estimated from the frame
+                  count while recording
+                - Number of live frames dropped because the encoder fell behind
         """
-        duration = time.time() - self.start_time if self.is_recording else 0.0
-        return self.output_path, self.frame_count, duration
+        duration = self.frame_count / self.fps if self.is_recording else 0.0
+        return self.output_path, self.frame_count, duration, self.dropped_frames
     
     def reset(self) -> None:
         """
@@ -0,0 +1,152 @@
+"""Tests for the video recorder's frame queue and writer thread."""
+
+import threading
+
+import cv2
+import numpy as np
+import pytest
+
+from froth_monitor.video_recorder import VideoRecorder
+
+WIDTH, HEIGHT = 32, 24
+
+
+def make_frame(value: int = 0) -> np.ndarray:
+    """Return a frame of the recording's dimensions filled with value."""
+    return np.full((HEIGHT, WIDTH, 3), value, np.uint8)
+
+
+def start(recorder: VideoRecorder, tmp_path, is_video_file: bool) -> None:
+    """Start an MJPEG recording, which needs no ffmpeg."""
+    assert recorder.start_recording(
+        str(tmp_path), "test", WIDTH, HEIGHT, 30.0, is_video_file, "mjpeg"
+    )
+
+
+def avi_frame_count(path: str) -> int:
+    """Return the number of frames in a recorded file."""
+    cap = cv2.VideoCapture(path)
+    count = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
+    cap.release()
+    return count
+
+
+def queued(recorder: VideoRecorder) -> list:
+    """Return the (fill value, repeat) of each queued frame."""
+    return [(int(frame[0, 0, 0]), repeat) for frame, repeat in recorder._queue.queue]
+
+
+def test_enqueue_newest_drops_incoming_frame():
+    """With the "newest" policy a full queue drops the incoming frame and its repeats."""
+    recorder = VideoRecorder(queue_size=2, drop_policy="newest")
+    recorder._enqueue(make_frame(1))
+    recorder._enqueue(make_frame(2), 3)
+    recorder._enqueue(make_frame(3), 2)
+
+    assert queued(recorder) == [(1, 1), (2, 3)]
+    assert recorder.frame_count == 4
+    assert recorder.dropped_frames == 2
+
+
+def test_enqueue_oldest_replaces_oldest_frame():
+    """With the "oldest" policy a full queue drops the oldest entry and its repeats."""
+    recorder = VideoRecorder(queue_size=2, drop_policy="oldest")
+    recorder._enqueue(make_frame(1), 4)
+    recorder._enqueue(make_frame(2))
+    recorder._enqueue(make_frame(3), 2)
+
+    assert queued(recorder) == [(2, 1), (3, 2)]
+    assert recorder.frame_count == 3
+    assert recorder.dropped_frames == 4
+
+
+def test_unknown_drop_policy():
+    """An unknown drop policy is rejected."""
+    with pytest.raises(ValueError):
+        VideoRecorder(drop_policy="random")
+
+
+def test_video_file_recording_never_drops_frames(tmp_path, monkeypatch):
+    """Frames of a video file wait for a slow encoder instead of being dropped."""
+    recorder = VideoRecorder(queue_size=1)
+    start(recorder, tmp_path, is_video_file=True)
+    write_frame = recorder._write_frame
+
+    def slow_write(frame, repeat=1):
+        threading.Event().wait(0.005)
+        write_frame(frame, repeat)
+
+    monkeypatch.setattr(recorder, "_write_frame", slow_write)
+    for i in range(20):
+        assert recorder.record_frame(make_frame(i))
+
+    success, path, frame_count, dropped_frames = recorder.stop_recording()
+    assert success
+    assert (frame_count, dropped_frames) == (20, 0)
+    assert avi_frame_count(path) == 20
+
+
+def test_stop_recording_drains_queue_and_reports_dropped_frames(tmp_path, monkeypatch):
+    """Queued live frames are written on stop, and the dropped ones are reported."""
+    recorder = VideoRecorder(queue_size=1)
+    start(recorder, tmp_path, is_video_file=False)
+    writing = threading.Event()
+    release = threading.Event()
+    written = []
+
+    def blocked_write(frame, repeat=1):
+        writing.set()
+        release.wait()
+        written.append(repeat)
+
+    monkeypatch.setattr(recorder, "_write_frame", blocked_write)
+    recorder._enqueue(make_frame(), 2)
+    assert writing.wait(5)
+    # The writer holds the first entry, so one more fits in the queue
+    for _ in range(4):
+        recorder._enqueue(make_frame())
+    release.set()
+
+    assert recorder.stop_recording()[1:] == (recorder.output_path, 3, 3)
+    assert written == [2, 1]
+    assert recorder._queue.empty()
+    assert recorder.get_recording_info()[3] == 3
+
+
+def test_writer_survives_write_error(tmp_path, monkeypatch):
+    """A failing write does not end the writer thread or block stop_recording."""
+    recorder = VideoRecorder(queue_size=1)
+    start(recorder, tmp_path, is_video_file=True)
+    write_frame = recorder._write_frame
+    calls = []
+
+    def failing_write(frame, repeat=1):
+        calls.append(repeat)
+        if len(calls) == 1:
+            raise ValueError("bad frame")
+        write_frame(frame, repeat)
+
+    monkeypatch.setattr(recorder, "_write_frame", failing_write)
+    for i in range(5):
+        recorder.record_frame(make_frame(i))
+
+    result = []
+    stopper = threading.Thread(target=lambda: result.append(recorder.stop_recording()))
+    stopper.start()
+    stopper.join(10)
+    assert not stopper.is_alive()
+    assert result[0][0]
+    assert len(calls) == 5
+    assert avi_frame_count(result[0][1]) == 4
+
+
+def test_first_frame_of_wrong_size_stops_recording(tmp_path):
+    """A first frame that does not match the recording stops it and reports why."""
+    recorder = VideoRecorder()
+    reasons = []
+    recorder.recording_failed.connect(reasons.append)
+    start(recorder, tmp_path, is_video_file=True)
+
+    assert not recorder.record_frame(np.zeros((HEIGHT * 2, WIDTH * 2, 3), np.uint8))
+    assert not recorder.is_recording
+    assert len(reasons) == 1